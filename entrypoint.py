@@ -26,11 +26,23 @@ if __name__ == "__main__":
     reload_on_change = (
         os.getenv("API_RELOAD_ON_CHANGE", default="False").title() == "True"
     )
+    # Worker processes cannot be combined with the reloader, which is for dev only.
+    # Cached resume reads follow the version stored in the database, but the auth
+    # caches are per process: with several workers, a deactivated user keeps working
+    # on the other workers for up to AUTH_CACHE_SECONDS/USER_CACHE_SECONDS, and
+    # lockouts are counted per worker. Keep API_WORKERS at 1 unless that is acceptable.
+    workers = None if reload_on_change else int(os.getenv("API_WORKERS", default="1"))
     uvicorn.run(
-        "main:app",
+        "resumeapi.main:app",
         host=host,
         port=int(port),
         proxy_headers=True,
+        # Only trust X-Forwarded-For from these proxies, so that login throttling
+        # sees each client's own address rather than the proxy's
+        forwarded_allow_ips=os.getenv("FORWARDED_ALLOW_IPS", default="127.0.0.1"),
         log_level=log_level,
         reload=reload_on_change,
+        workers=workers,
+        loop=os.getenv("API_LOOP", default="uvloop"),
+        http=os.getenv("API_HTTP", default="httptools"),
     )
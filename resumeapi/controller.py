@@ -3,32 +3,429 @@
 # pylint: disable=too-many-lines
 
 import ast
+import asyncio
+import base64
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, wraps
+import hashlib
+import hmac
 import logging
 import os
+import secrets
+import threading
+import time
 
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional
 
+import bcrypt
+from cachetools import TLRUCache, TTLCache
+from cachetools.keys import hashkey
 from dotenv import load_dotenv
-from jose import jwt  # noqa
+import jwt
+import orjson
 
-from passlib.context import CryptContext
+from sqlalchemy import bindparam, delete, event, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from resumeapi import models
 
+load_dotenv()
+SECRET_KEY = os.getenv("SECRET_KEY")
+ALGORITHM = os.getenv("ALGORITHM")
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", default="12"))
+AUTH_CACHE_SECONDS = int(os.getenv("AUTH_CACHE_SECONDS", default="60"))
+FAILED_AUTH_CACHE_SECONDS = int(os.getenv("FAILED_AUTH_CACHE_SECONDS", default="5"))
+LOGIN_FAILURE_WINDOW_SECONDS = int(
+    os.getenv("LOGIN_FAILURE_WINDOW_SECONDS", default="60")
+)
+MAX_LOGIN_FAILURES = int(os.getenv("MAX_LOGIN_FAILURES", default="10"))
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", default="4096"))
+TOKEN_USER_CACHE_SECONDS = int(os.getenv("TOKEN_USER_CACHE_SECONDS", default="30"))
+REJECTED_TOKEN_CACHE_SECONDS = int(
+    os.getenv("REJECTED_TOKEN_CACHE_SECONDS", default="60")
+)
+MAX_TOKEN_LENGTH = 4096
+USER_CACHE_SECONDS = int(os.getenv("USER_CACHE_SECONDS", default="60"))
+READ_CACHE_SECONDS = int(os.getenv("READ_CACHE_SECONDS", default="300"))
+RESUME_CACHE_ID = models.RESUME_CACHE_ID
+
+_read_cache = TTLCache(maxsize=256, ttl=READ_CACHE_SECONDS)
+_read_cache_lock = threading.RLock()
+_MISSING = object()
+
+# Statements are built once and reused with bound parameters so that SQLAlchemy can
+# serve their compiled form from its statement cache.
+_SELECT_USER = select(models.User).where(models.User.username == bindparam("username"))
+_SELECT_BASIC_INFO = select(models.BasicInfo).where(
+    models.BasicInfo.fact == bindparam("fact")
+)
+_SELECT_EDUCATION = select(models.Education).where(
+    models.Education.institution == bindparam("institution"),
+    models.Education.degree == bindparam("degree"),
+    models.Education.graduation_date == bindparam("graduation_date"),
+)
+_SELECT_JOB_DETAILS = select(models.JobDetail).where(
+    models.JobDetail.job_id == bindparam("job_id")
+)
+_SELECT_JOB_HIGHLIGHTS = select(models.JobHighlight).where(
+    models.JobHighlight.job_id == bindparam("job_id")
+)
+_SELECT_PREFERENCE = select(models.Preference).where(
+    models.Preference.preference == bindparam("preference")
+)
+_SELECT_CERTIFICATION = select(models.Certification).where(
+    models.Certification.cert == bindparam("cert")
+)
+_SELECT_SIDE_PROJECT = select(models.SideProject).where(
+    models.SideProject.title == bindparam("title")
+)
+_SELECT_INTEREST_TYPE = select(models.InterestType).where(
+    models.InterestType.interest_type == bindparam("interest_type")
+)
+_SELECT_INTEREST = select(models.Interest).where(
+    models.Interest.interest == bindparam("interest")
+)
+# SQLModel only sets __table__ once each table model class is created
+# pylint: disable=no-member
+_SELECT_INTERESTS_BY_TYPE = (
+    select(models.Interest.__table__)
+    .join(models.InterestType, isouter=True)
+    .where(models.InterestType.interest_type == bindparam("interest_type"))
+)
+_SELECT_SOCIAL_LINK = select(models.SocialLink).where(
+    models.SocialLink.platform == bindparam("platform")
+)
+_SELECT_SKILL = select(models.Skill).where(models.Skill.skill == bindparam("skill"))
+_SELECT_COMPETENCY = select(models.Competency).where(
+    models.Competency.competency == bindparam("competency")
+)
+_SELECT_JOB = select(models.Job).where(models.Job.employer == bindparam("employer"))
+_SELECT_USERS = select(models.User)
+_SELECT_RESUME_VERSION = select(models.ResumeCache.version).where(
+    models.ResumeCache.id == RESUME_CACHE_ID
+)
+_SELECT_ALL_BASIC_INFO = select(models.BasicInfo.fact, models.BasicInfo.value)
+_SELECT_ALL_EDUCATION = select(models.Education.__table__)
+_SELECT_EXPERIENCE = (
+    select(models.Job)
+    .options(selectinload(models.Job.details), selectinload(models.Job.highlights))
+    .order_by(models.Job.id)
+)
+_SELECT_ALL_PREFERENCES = select(models.Preference.preference, models.Preference.value)
+_SELECT_ALL_CERTIFICATIONS = select(models.Certification.__table__)
+_SELECT_VALID_CERTIFICATIONS = _SELECT_ALL_CERTIFICATIONS.where(
+    models.Certification.valid
+)
+_SELECT_ALL_SIDE_PROJECTS = select(models.SideProject.__table__)
+_SELECT_ALL_INTERESTS = select(
+    models.Interest.interest, models.InterestType.interest_type
+).join(models.InterestType, isouter=True)
+_SELECT_ALL_SOCIAL_LINKS = select(models.SocialLink.__table__)
+_SELECT_ALL_SKILLS = select(models.Skill.__table__)
+_SELECT_ALL_COMPETENCIES = select(models.Competency.__table__)
+# pylint: enable=no-member
+_SELECT_COMPETENCY_NAMES = select(models.Competency.competency)
+
+
+def get_session() -> Iterator[Session]:
+    """
+    Provide a single database session for the lifetime of a request.
+
+    :return: An open database session
+    :rtype: Iterator[Session]
+    """
+    with models.SessionLocal() as session:
+        yield session
+
+
+def _b64url(data: bytes) -> bytes:
+    """
+    Encode bytes as unpadded URL-safe base64, as used in JSON web tokens.
+
+    :param data: The bytes to encode
+    :type data: bytes
+    :return: The encoded bytes
+    :rtype: bytes
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _token_user_expiry(_key, value, now: float) -> float:
+    """
+    Expire a cached token user after the cache TTL or when its token expires.
+
+    :param _key: The hashed token the user is cached under (unused)
+    :param value: The cached user and the expiry timestamp of their token
+    :type value: tuple
+    :param now: The current time
+    :type now: float
+    :return: The time at which the cached entry expires
+    :rtype: float
+    """
+    return min(now + TOKEN_USER_CACHE_SECONDS, value[1])
+
+
+# HS256 tokens are signed directly, reusing the pre-encoded header and key
+_TOKEN_HEADER = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+_TOKEN_SIGNING_KEY = (SECRET_KEY or "").encode()
+# PyJWT checks the accepted algorithms on every decode, so the sequence is built once
+_ALGORITHMS = (ALGORITHM,)
+
+
+def _parse_value(value: str):
+    """
+    Parse a stored value into a list, number, etc. where it holds one.
+
+    Values are stored as Python literals (e.g. single-quoted lists); anything that is
+    not a literal, such as a plain name or email address, is returned as-is. Parsed
+    sections are cached, so this only runs when a section is rebuilt.
+
+    :param value: The value as stored in the database
+    :type value: str
+    :return: The parsed value, or the original string if it could not be parsed
+    """
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
+def _insert(model):
+    """
+    Build an INSERT statement supporting ON CONFLICT for the configured database.
+
+    :param model: The table model to insert into
+    :return: An INSERT statement for the database dialect in use
+    :rtype: sqlalchemy.sql.dml.Insert
+    """
+    if models.engine.dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+def _resume_version(session: Session) -> Optional[int]:
+    """
+    Read the version of the resume, which every write to any section increments.
+
+    The version is stored in the database, so it is shared by every API process.
+
+    :param session: An open database session
+    :type session: Session
+    :return: The current version of the resume
+    :rtype: int, optional
+    """
+    return session.exec(_SELECT_RESUME_VERSION).first()
+
+
+def _read_through(session: Session, key: tuple, build: Callable):
+    """
+    Return the value cached in memory for a key, building and caching it on a miss.
+
+    Values are cached under the current version of the resume, so a write committed
+    by any process makes the values cached before it unreachable. They are then
+    left to age out of the cache. Nothing is cached while the session itself holds
+    uncommitted writes to the resume, since those may still be rolled back.
+
+    :param session: An open database session
+    :type session: Session
+    :param key: The key identifying the value within a version of the resume
+    :type key: tuple
+    :param build: Builds the value when it is not cached
+    :type build: Callable
+    :return: The cached or newly built value
+    """
+    if session.info.get("resume_written"):
+        return build()
+    key = hashkey(_resume_version(session), *key)
+    with _read_cache_lock:
+        value = _read_cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = build()
+        with _read_cache_lock:
+            _read_cache[key] = value
+    return value
+
+
+def _cached_section(section: str):
+    """
+    Cache a getter's result in memory until any part of the resume is written.
+
+    The database session passed to the getter is not part of the cache key.
+
+    :param section: The section of the resume the getter reads
+    :type section: str
+    :return: A decorator caching the getter's result
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def getter(session: Session, *args, **kwargs):
+            return _read_through(
+                session,
+                (section, func.__name__, *args, *sorted(kwargs.items())),
+                lambda: func(session, *args, **kwargs),
+            )
+
+        getter.section = section
+        return getter
+
+    return decorator
+
+
+def _upsert(session: Session, model, values: dict, key: str) -> CursorResult:
+    """
+    Insert a row, or update the existing row holding the same unique key.
+
+    :param session: An open database session
+    :type session: Session
+    :param model: The table model to write to
+    :param values: The column values to write
+    :type values: dict
+    :param key: The name of the unique column identifying an existing row
+    :type key: str
+    :return: The result of the INSERT statement
+    :rtype: sqlalchemy.engine.CursorResult
+    """
+    statement = _insert(model).values(**values)
+    changes = {
+        column: statement.excluded[column]
+        for column in values
+        if column not in (key, "id")
+    }
+    if changes:
+        statement = statement.on_conflict_do_update(index_elements=[key], set_=changes)
+    else:
+        statement = statement.on_conflict_do_nothing(index_elements=[key])
+    return session.execute(statement)
+
+
+def _invalidate_caches(session: Session) -> None:
+    """
+    Mark every cached copy of the resume as stale as part of the pending transaction.
+
+    The version of the resume is incremented and the serialized full resume is
+    cleared in the database, so the change reaches every API process as soon as the
+    transaction commits.
+
+    :param session: An open database session
+    :type session: Session
+    """
+    session.execute(
+        update(models.ResumeCache)
+        .where(models.ResumeCache.id == RESUME_CACHE_ID)
+        .values(payload=None, version=models.ResumeCache.version + 1)
+    )
+    session.info["resume_written"] = True
+
+
+@event.listens_for(models.SessionLocal, "after_commit")
+@event.listens_for(models.SessionLocal, "after_soft_rollback")
+def _end_resume_write(session: Session, *_args) -> None:
+    """
+    Allow a session to cache reads again once its writes are committed or discarded.
+
+    :param session: The session that has just committed or rolled back
+    :type session: Session
+    """
+    session.info.pop("resume_written", None)
+
+
+class NotFoundError(KeyError):
+    """The requested resume item does not exist."""
+
+
+class _LockedCache:
+    """Guard a cachetools cache with a lock, so that threads can share it."""
+
+    def __init__(self, cache) -> None:
+        """
+        Guard the given cache.
+
+        :param cache: The cachetools cache to guard
+        """
+        self._cache = cache
+        self._lock = threading.Lock()
+
+    def __contains__(self, key) -> bool:
+        """Check whether a key is cached."""
+        with self._lock:
+            return key in self._cache
+
+    def __setitem__(self, key, value) -> None:
+        """Cache a value under a key."""
+        with self._lock:
+            self._cache[key] = value
+
+    def get(self, key, default=None):
+        """
+        Look up a key, as :meth:`dict.get` does.
+
+        :param key: The key to look up
+        :param default: The value to return if the key is not cached
+        :return: The cached value, or the default
+        """
+        with self._lock:
+            return self._cache.get(key, default)
+
+    def clear(self) -> None:
+        """Forget every cached entry."""
+        with self._lock:
+            self._cache.clear()
+
+
+class _AuthCaches:  # pylint: disable=too-few-public-methods
+    """The short-lived caches behind :class:`AuthController`."""
+
+    def __init__(self) -> None:
+        """Create empty caches."""
+        self.credentials_key = secrets.token_bytes(32)
+        self.auth = _LockedCache(TTLCache(maxsize=4096, ttl=AUTH_CACHE_SECONDS))
+        self.failed_auth = _LockedCache(
+            TTLCache(maxsize=1024, ttl=FAILED_AUTH_CACHE_SECONDS)
+        )
+        self.login_failures = _LockedCache(
+            TTLCache(maxsize=4096, ttl=LOGIN_FAILURE_WINDOW_SECONDS)
+        )
+        self.token_users = _LockedCache(
+            TLRUCache(maxsize=10_000, ttu=_token_user_expiry, timer=time.time)
+        )
+        self.rejected_tokens = _LockedCache(
+            TTLCache(maxsize=1024, ttl=REJECTED_TOKEN_CACHE_SECONDS)
+        )
+        self.users = _LockedCache(TTLCache(maxsize=1024, ttl=USER_CACHE_SECONDS))
+
+    def forget_users(self) -> None:
+        """Forget every cached user, e.g. after a user's status changes."""
+        self.auth.clear()
+        self.token_users.clear()
+        self.users.clear()
+
 
 class AuthController:
     """Interact with authentication methods."""
 
     def __init__(self) -> None:
         """Interact with authentication methods."""
-        load_dotenv()
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        self.secret_key = os.getenv("SECRET_KEY")
-        self.algorithm = os.getenv("ALGORITHM")
+        self.bcrypt_rounds = BCRYPT_ROUNDS
         self.logger = logging.getLogger(__name__)
+        self._caches = _AuthCaches()
+        self._verify_token = lru_cache(maxsize=TOKEN_CACHE_SIZE)(self._verify_signature)
+
+    # Tokens are signed and verified with the module settings, which the pre-encoded
+    # HS256 header and key are built from, so these are read-only views of them.
+    @property
+    def secret_key(self) -> Optional[str]:
+        """The key access tokens are signed and verified with."""
+        return SECRET_KEY
+
+    @property
+    def algorithm(self) -> Optional[str]:
+        """The algorithm access tokens are signed and verified with."""
+        return ALGORITHM
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -41,7 +438,7 @@ class AuthController:
         :return: Whether the password matches
         :rtype: bool
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
     def get_password_hash(self, password: str) -> str:
         """
@@ -52,30 +449,45 @@ class AuthController:
         :return: The bcrypt-hashed password
         :rtype: str
         """
-        return self.pwd_context.hash(password)
+        return bcrypt.hashpw(
+            password.encode(), bcrypt.gensalt(rounds=self.bcrypt_rounds)
+        ).decode()
 
-    @staticmethod
-    def get_user(username: str) -> models.User:
+    def get_user(self, username: str) -> models.User:
         """
         Get information about the requested user.
 
+        Users are cached by username for a short time; missing users are not.
+
         :param username: The username of the user to look up
         :type username: str
         :return: The requested user
         :rtype: models.User
         :raises KeyError: No such user exists.
         """
-        with Session(models.engine) as session:
-            statement = select(models.User).where(models.User.username == username)
-            results = session.exec(statement).first()
+        user = self._caches.users.get(username)
+        if user is not None:
+            return user
+        with models.SessionLocal() as session:
+            results = session.exec(_SELECT_USER, params={"username": username}).first()
             if results is None:
                 raise KeyError("No such user exists")
-            return results
+        self._caches.users[username] = results
+        return results
 
-    def authenticate_user(self, username: str, password: str) -> models.User:
+    async def authenticate_user(self, username: str, password: str) -> models.User:
         """
         Authenticate a user.
 
+        The user lookup and the bcrypt verification both run in a worker thread so
+        that they do not block the event loop.
+
+        Successful authentications are remembered for a short time, keyed on an
+        HMAC of the credentials rather than the password itself, so that repeat
+        logins skip bcrypt entirely. Failed attempts are remembered for a few
+        seconds as well, so replaying the same bad credentials is rejected without
+        running bcrypt again.
+
         :param username:
         :type username: str
         :param password:
@@ -83,15 +495,70 @@ class AuthController:
         :return: The authenticated user
         :rtype: models.User
         :raises KeyError: No such user exists.
-        """
-        user = self.get_user(username)
+        :raises ValueError: The password is incorrect, the user is disabled, or the
+            same credentials failed moments ago.
+        """
+        cache_key = hmac.new(
+            self._caches.credentials_key, f"{username}:{password}".encode(), "sha256"
+        ).digest()
+        user = self._caches.auth.get(cache_key)
+        if user is not None:
+            return user
+        if cache_key in self._caches.failed_auth:
+            raise ValueError("Incorrect password")
+        try:
+            user = await asyncio.to_thread(self.get_user, username)
+        except KeyError:
+            self._caches.failed_auth[cache_key] = True
+            raise
         self.logger.debug("User %s found", user.username)
-        if self.verify_password(password, user.password) and not user.disabled:
+        verified = await asyncio.to_thread(
+            self.verify_password, password, user.password
+        )
+        if verified and not user.disabled:
             self.logger.info("Successful authentication")
+            self._caches.auth[cache_key] = user
             return user
         self.logger.error("Incorrect password")
+        self._caches.failed_auth[cache_key] = True
         raise ValueError("Incorrect password")
 
+    def login_retry_after(self, client: str, username: str) -> int:
+        """
+        Determine how long a client must wait before logging in as a user again.
+
+        Failed logins are counted per client address and username in fixed windows
+        of LOGIN_FAILURE_WINDOW_SECONDS, so failing again while locked out does not
+        push the end of the lockout further away.
+
+        :param client: The address of the client attempting to log in
+        :type client: str
+        :param username: The username the client is attempting to log in as
+        :type username: str
+        :return: The seconds left in the current window if the client has reached
+            the failed login limit, otherwise 0
+        :rtype: int
+        """
+        window, elapsed = divmod(time.time(), LOGIN_FAILURE_WINDOW_SECONDS)
+        key = (client, username.lower(), int(window))
+        if self._caches.login_failures.get(key, 0) < MAX_LOGIN_FAILURES:
+            return 0
+        return LOGIN_FAILURE_WINDOW_SECONDS - int(elapsed)
+
+    def record_login_failure(self, client: str, username: str) -> None:
+        """
+        Count a failed login against a client and username in the current window.
+
+        :param client: The address of the client that failed to log in
+        :type client: str
+        :param username: The username the client failed to log in as
+        :type username: str
+        """
+        window = int(time.time() // LOGIN_FAILURE_WINDOW_SECONDS)
+        key = (client, username.lower(), window)
+        failures = self._caches.login_failures
+        failures[key] = failures.get(key, 0) + 1
+
     def create_access_token(
         self, data: dict, expires_delta: Optional[timedelta] = None
     ) -> str:
@@ -107,12 +574,111 @@ class AuthController:
         """
         to_encode = data.copy()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = datetime.now(timezone.utc) + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=15)
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+            expire = datetime.now(timezone.utc) + timedelta(minutes=15)
+        to_encode.update({"exp": int(expire.timestamp())})
+        if ALGORITHM != "HS256":
+            return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        signing_input = _TOKEN_HEADER + b"." + _b64url(orjson.dumps(to_encode))
+        signature = hmac.new(_TOKEN_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+        return (signing_input + b"." + _b64url(signature)).decode()
+
+    def _verify_signature(self, token: str) -> dict:
+        """
+        Verify the signature of an access token without checking its expiry.
+
+        :param token: An encoded JSON web token
+        :type token: str
+        :return: The claims stored in the token
+        :rtype: dict
+        :raises jwt.PyJWTError: The token is invalid.
+        """
+        return jwt.decode(
+            token,
+            SECRET_KEY,
+            algorithms=_ALGORITHMS,
+            options={"verify_exp": False},
+        )
+
+    def decode_access_token(self, token: str) -> dict:
+        """
+        Verify an access token and return its claims.
+
+        Verified signatures are cached by token, so only the expiry is checked again
+        when the same token is presented more than once.
+
+        :param token: An encoded JSON web token
+        :type token: str
+        :return: The claims stored in the token
+        :rtype: dict
+        :raises jwt.PyJWTError: The token is invalid or has expired.
+        """
+        claims = self._verify_token(token)
+        if "exp" in claims and claims["exp"] <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return claims
+
+    def get_cached_token_user(self, token: str) -> Optional[models.User]:
+        """
+        Look up the user cached for an access token without verifying it.
+
+        :param token: An encoded JSON web token
+        :type token: str
+        :return: The cached user, or None if the token has no live cache entry
+        :rtype: models.User, optional
+        """
+        cache_key = hashlib.sha256(token.encode()).digest()
+        cached_user = self._caches.token_users.get(cache_key)
+        return cached_user[0] if cached_user is not None else None
+
+    def is_rejected_token(self, token: str) -> bool:
+        """
+        Rule out tokens that cannot be valid without verifying their signature.
+
+        Tokens that are not made of three segments, that are implausibly long, or
+        that recently failed verification are all rejected.
+
+        :param token: An encoded JSON web token
+        :type token: str
+        :return: Whether the token can be rejected outright
+        :rtype: bool
+        """
+        if token.count(".") != 2 or len(token) > MAX_TOKEN_LENGTH:
+            return True
+        cache_key = hashlib.sha256(token.encode()).digest()
+        return cache_key in self._caches.rejected_tokens
+
+    def get_token_user(self, token: str) -> models.User:
+        """
+        Identify the user an access token was issued to.
+
+        The user is cached by token hash for a short time, and never past the
+        token's own expiry. Tokens that fail verification are remembered so that
+        :meth:`is_rejected_token` can turn them away.
+
+        :param token: An encoded JSON web token
+        :type token: str
+        :return: The user named by the token
+        :rtype: models.User
+        :raises jwt.PyJWTError: The token is invalid or has expired.
+        :raises KeyError: The token does not name an existing user.
+        """
+        user = self.get_cached_token_user(token)
+        if user is not None:
+            return user
+        cache_key = hashlib.sha256(token.encode()).digest()
+        try:
+            claims = self.decode_access_token(token)
+        except jwt.PyJWTError:
+            self._caches.rejected_tokens[cache_key] = True
+            raise
+        username = claims.get("sub")
+        if not username:
+            raise KeyError("The token does not name a user")
+        user = self.get_user(username)
+        self._caches.token_users[cache_key] = (user, claims.get("exp", float("inf")))
+        return user
 
     def create_user(
         self, username: str, password: str, disabled: bool = False
@@ -129,7 +695,7 @@ class AuthController:
         :return: The created user
         :rtype: models.User
         """
-        with Session(models.engine) as session:
+        with models.SessionLocal() as session:
             user = models.User(
                 username=username.lower(),
                 password=self.get_password_hash(password),
@@ -137,7 +703,6 @@ class AuthController:
             )
             session.add(user)
             session.commit()
-            session.refresh(user)
         return user
 
     def deactivate_user(self, username: str) -> models.User:
@@ -151,662 +716,700 @@ class AuthController:
         :raises KeyError: The user does not exist in the DB
         """
         self.logger.info("Attempting to deactivate user %s", username)
-        with Session(models.engine) as session:
-            statement = select(models.User).where(
-                models.User.username == username.lower()
+        with models.SessionLocal() as session:
+            updated = session.execute(
+                update(models.User)
+                .where(models.User.username == username.lower())
+                .values(disabled=True)
             )
-            results = session.exec(statement)
-            user = results.one()
-            if not user:
+            if not updated.rowcount:
                 self.logger.error(
                     "Failed to deactivate user %s because they are not in the db!",
                     username,
                 )
                 raise KeyError("The requested user does not exist!")
-            user.disabled = True
             session.commit()
-            session.refresh(user)
+            self._caches.forget_users()
             self.logger.info("Successfully deactivated user %s", username)
-            return user
+            return session.exec(
+                _SELECT_USER, params={"username": username.lower()}
+            ).one()
 
 
 class ResumeController:
     """Interact with resume methods."""
 
     @staticmethod
-    def get_all_users() -> List[models.User]:
+    def get_all_users(session: Session) -> List[models.User]:
         """
         List all configured users for auditing purposes.
 
+        :param session: An open database session
+        :type session: Session
         :return: Username and disabled status of each user
         :rtype: dict
         """
-        with Session(models.engine) as session:
-            statement = select(models.User)
-            results = session.exec(statement).all()
-            return results
+        results = session.exec(_SELECT_USERS).all()
+        return results
 
     @staticmethod
-    def get_basic_info() -> models.BasicInfos:
+    @_cached_section("basic_info")
+    def get_basic_info(session: Session) -> models.BasicInfos:
         """
         List all configured basic info facts.
 
+        :param session: An open database session
+        :type session: Session
         :return: All facts
         :rtype: dict
         """
-        with Session(models.engine) as session:
-            statement = select(models.BasicInfo)
-            results = session.exec(statement).all()
-            repsonse_dict = dict()
-            for info in results:
-                try:
-                    repsonse_dict[info.fact] = ast.literal_eval(info.value)
-                except (ValueError, SyntaxError):
-                    repsonse_dict[info.fact] = info.value
-            resp = models.BasicInfos.parse_obj(repsonse_dict)
-            return resp
+        repsonse_dict = {
+            fact: _parse_value(value)
+            for fact, value in session.execute(_SELECT_ALL_BASIC_INFO)
+        }
+        resp = models.BasicInfos.parse_obj(repsonse_dict)
+        return resp
 
     @staticmethod
-    def get_basic_info_item(fact: str) -> models.BasicInfo:
+    @_cached_section("basic_info")
+    def get_basic_info_item(session: Session, fact: str) -> models.BasicInfo:
         """
         Find the value of the requested basic value fact.
 
+        :param session: An open database session
+        :type session: Session
         :param fact: The fact to look up (e.g. name)
         :type fact: str
         :return: The requested fact
         :rtype dict:
-        :raises KeyError: The requested fact does not exist.
+        :raises NotFoundError: The requested fact does not exist.
         """
-        with Session(models.engine) as session:
-            statement = select(models.BasicInfo).where(models.BasicInfo.fact == fact)
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("Fact does not exist in the DB.")
-            return results
+        results = session.exec(_SELECT_BASIC_INFO, params={"fact": fact}).first()
+        if results is None:
+            raise NotFoundError(f"No basic info item {fact}")
+        return results
 
     @staticmethod
-    def upsert_basic_info_item(item: models.BasicInfo) -> models.BasicInfo:
+    def upsert_basic_info_item(
+        session: Session, item: models.BasicInfo
+    ) -> models.BasicInfo:
         """
         Create or update an existing fact.
 
+        :param session: An open database session
+        :type session: Session
         :param item: k/v pair of the fact "fact" and the "value"
         :type item: dict
         :return: The k/v pair
         :rtype: dict
         """
-        with Session(models.engine) as session:
-            statement = select(models.BasicInfo).where(
-                models.BasicInfo.fact == item.fact
-            )
-            fact = session.exec(statement).first()
-            if fact is None:
-                fact = models.BasicInfo()
-            for key, value in item.dict(exclude_unset=True).items():
-                setattr(fact, key, value)
-            session.add(fact)
-            session.commit()
-            session.refresh(fact)
-            return fact
+        _upsert(session, models.BasicInfo, item.dict(exclude_unset=True), "fact")
+        _invalidate_caches(session)
+        session.commit()
+        return session.exec(_SELECT_BASIC_INFO, params={"fact": item.fact}).one()
 
     @staticmethod
-    def delete_basic_info_item(fact: str) -> None:
+    def delete_basic_info_item(session: Session, fact: str) -> None:
         """
         Delete an existing fact.
 
+        :param session: An open database session
+        :type session: Session
         :param fact: The name of the fact
         :type fact: str
-        :raises KeyError: The fact does not exist in the DB.
+        :raises NotFoundError: The fact does not exist in the DB.
         """
-        with Session(models.engine) as session:
-            statement = select(models.BasicInfo).where(models.BasicInfo.fact == fact)
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested fact does not exist")
-            session.delete(results)
-            session.commit()
+        deleted = session.execute(
+            delete(models.BasicInfo).where(models.BasicInfo.fact == fact)
+        )
+        if not deleted.rowcount:
+            raise NotFoundError(f"No such fact '{fact}'")
+        _invalidate_caches(session)
+        session.commit()
 
     @staticmethod
-    def get_all_education_history() -> List[models.Education]:
+    @_cached_section("education")
+    def get_all_education_history(session: Session) -> List[dict]:
         """
         Retrieve all education history objects stored in the database.
 
+        :param session: An open database session
+        :type session: Session
         :return: All education history objects.
-        :rtype: list
+        :rtype: List[dict]
         """
-        with Session(models.engine) as session:
-            statement = select(models.Education)
-            results = [e[0] for e in session.execute(statement).all()]
-            return results
+        results = [
+            dict(row) for row in session.execute(_SELECT_ALL_EDUCATION).mappings()
+        ]
+        return results
 
     @staticmethod
-    def get_education_item(index: int) -> models.Education:
+    @_cached_section("education")
+    def get_education_item(session: Session, index: int) -> models.Education:
         """
         Retrieve and education object by its id (index).
 
+        :param session: An open database session
+        :type session: Session
         :param index: The ID of the education entry
         :type index: int
         :return: Details about the requested education item.
         :rtype: dict
-        :raises IndexError: No item exists at this index.
+        :raises NotFoundError: No item exists at this index.
         """
-        with Session(models.engine) as session:
-            results = session.get(models.Education, index)
-            if not results:
-                raise IndexError("No item exists at this index.")
-            return results
+        results = session.get(models.Education, index)
+        if not results:
+            raise NotFoundError(f"No education item {index}")
+        return results
 
     @staticmethod
-    def upsert_education_item(edu: models.Education) -> models.Education:
+    def upsert_education_item(
+        session: Session, edu: models.Education
+    ) -> models.Education:
         """
         Create or update an education item.
 
+        :param session: An open database session
+        :type session: Session
         :param edu: An Education schema object
         :type edu: schema.Education
         :return: Details of the new or updated education item
         :rtype schema.Education
         """
-        with Session(models.engine) as session:
-            statement = (
-                select(models.Education)
-                .where(models.Education.institution == edu.institution)
-                .where(
-                    models.Education.degree == edu.degree,
-                    models.Education.graduation_date == edu.graduation_date,
-                )
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                results = edu
-            for key, value in results.dict(exclude_unset=True).items():
+        results = session.exec(
+            _SELECT_EDUCATION,
+            params={
+                "institution": edu.institution,
+                "degree": edu.degree,
+                "graduation_date": edu.graduation_date,
+            },
+        ).first()
+        if results is None:
+            results = edu
+        else:
+            for key, value in edu.dict(exclude_unset=True).items():
                 setattr(results, key, value)
-            session.add(results)
-            session.commit()
-            session.refresh(results)
-            return results
+        session.add(results)
+        _invalidate_caches(session)
+        session.commit()
+        return results
 
     @staticmethod
-    def delete_education_item(index: int) -> None:
+    def delete_education_item(session: Session, index: int) -> None:
         """
         Delete an existing education item.
 
+        :param session: An open database session
+        :type session: Session
         :param index: The ID of the education items to delete
         :type index: int
-        :raises KeyError: No item exists at this index.
+        :raises NotFoundError: No item exists at this index.
         """
-        with Session(models.engine) as session:
-            item = session.get(models.Education, index)
-            if not item:
-                raise IndexError("No item exists at this index.")
-            session.delete(item)
-            session.commit()
+        item = session.get(models.Education, index)
+        if not item:
+            raise NotFoundError("No such education item exists")
+        session.delete(item)
+        _invalidate_caches(session)
+        session.commit()
 
-    @classmethod
-    def get_experience(cls) -> List[models.JobResponse]:
+    @staticmethod
+    @_cached_section("experience")
+    def get_experience(session: Session) -> List[models.JobResponse]:
         """
         Retrieve a list of previous jobs.
 
+        :param session: An open database session
+        :type session: Session
         :return: All previous jobs and their related details.
         :rtype list:
         """
-        resp = []
-        with Session(models.engine) as session:
-            statement = select(models.Job)
-            results = session.exec(statement).all()
-            for job in results:
-                j = ResumeController.get_experience_item(job.id)
-                resp.append(j)
-            return resp
+        return [
+            ResumeController._job_response(job)
+            for job in session.exec(_SELECT_EXPERIENCE)
+        ]
 
-    @classmethod
-    def get_experience_item(cls, job_id: int) -> models.JobResponse:
+    @staticmethod
+    def _job_response(job: models.Job) -> models.JobResponse:
+        """
+        Build the response for a job from its already-loaded details and highlights.
+
+        :param job: The job whose details and highlights have been loaded
+        :type job: models.Job
+        :return: The details of the job
+        :rtype: schema.JobResponse
+        """
+        response = models.JobResponse.parse_obj(job.dict())
+        response.details = [detail_item.detail for detail_item in job.details]
+        response.highlights = [
+            highlight_item.highlight for highlight_item in job.highlights
+        ]
+        return response
+
+    @staticmethod
+    @_cached_section("experience")
+    def get_experience_item(session: Session, job_id: int) -> models.JobResponse:
         """
         Retrieve details for previous job.
 
+        :param session: An open database session
+        :type session: Session
         :param job_id: The ID of the experience item to return
         :type job_id: int
         :return: The details of the job
         :rtype: schema.JobResponse
-        """
-        with Session(models.engine) as session:
-            results = session.get(models.Job, job_id)
-            if results is None:
-                raise IndexError("No such experience exists in the DB.")
-            response = models.JobResponse.parse_obj(results.dict())
-            details = ResumeController.get_experience_detail(job_id)
-            if details is not None:
-                setattr(response, "details", [])
-                for detail_item in details:
-                    response.details.append(detail_item.detail)
-            highlights = ResumeController.get_experience_highlight(job_id)
-            if highlights is not None:
-                setattr(response, "highlights", [])
-                for highlight_item in highlights:
-                    response.highlights.append(highlight_item.highlight)
-            return response
+        :raises NotFoundError: No such experience exists in the DB.
+        """
+        results = session.get(
+            models.Job,
+            job_id,
+            options=[
+                selectinload(models.Job.details),
+                selectinload(models.Job.highlights),
+            ],
+        )
+        if results is None:
+            raise NotFoundError(f"No experience item {job_id}")
+        return ResumeController._job_response(results)
 
     @staticmethod
-    def get_experience_detail(job_id: int) -> List[models.JobDetail]:
+    def get_experience_detail(session: Session, job_id: int) -> List[models.JobDetail]:
         """
         Gather details about the requested Job.
 
+        :param session: An open database session
+        :type session: Session
         :param job_id: The ID of the job whose details to return
         :type job_id: int
         :return: All details for the requested Job
         :rtype: list
         """
-        with Session(models.engine) as session:
-            statement = select(models.JobDetail).where(
-                models.JobDetail.job_id == job_id
-            )
-            details = session.exec(statement).all()
-            return details
+        details = session.exec(_SELECT_JOB_DETAILS, params={"job_id": job_id}).all()
+        return details
 
     @staticmethod
-    def get_experience_highlight(job_id: int) -> List[models.JobHighlight]:
+    def get_experience_highlight(
+        session: Session, job_id: int
+    ) -> List[models.JobHighlight]:
         """
         Gather highlights from the requested Job.
 
+        :param session: An open database session
+        :type session: Session
         :param job_id: The ID of the job whose highlights to return
         :type job_id: int
         :return: All highlights for the requested Job
         :rtype: list
         """
-        with Session(models.engine) as session:
-            statement = select(models.JobHighlight).where(
-                models.JobHighlight.job_id == job_id
-            )
-            details = session.exec(statement).all()
-            return details
+        details = session.exec(_SELECT_JOB_HIGHLIGHTS, params={"job_id": job_id}).all()
+        return details
 
     @staticmethod
-    def upsert_experience_item(job: models.Job) -> models.Job:
+    def upsert_experience_item(session: Session, job: models.Job) -> models.Job:
         """
         Create or update an experience item.
 
+        :param session: An open database session
+        :type session: Session
         :param job: The job to add to the job history
         :type job: schema.Job
         :return: The job added to the job history
         :rtype: schema.Job
         """
-        with Session(models.engine) as session:
-            statement = select(models.Job).where(models.Job.employer == job.employer)
-            results = session.exec(statement).first()
-            if results is None:
-                results = job
+        results = session.exec(_SELECT_JOB, params={"employer": job.employer}).first()
+        if results is None:
+            results = job
+        else:
             for key, value in job.dict(exclude_unset=True).items():
                 setattr(results, key, value)
-            session.add(results)
-            session.commit()
-            session.refresh(results)
-            return results
+        session.add(results)
+        _invalidate_caches(session)
+        session.commit()
+        return results
 
     @staticmethod
-    def delete_experience_item(index: int) -> None:
+    def delete_experience_item(session: Session, index: int) -> None:
         """
         Delete a Job item by the given index (id).
 
+        :param session: An open database session
+        :type session: Session
         :param index: The ID of the job to delete
         :type index: int
-        :raises IndexError: No such item exists at this index.
+        :raises NotFoundError: No such item exists at this index.
         """
-        with Session(models.engine) as session:
-            results = session.get(models.Job, index)
-            if results is None:
-                raise IndexError("No item exists at this index.")
-            session.delete(results)
-            session.commit()
+        results = session.get(models.Job, index)
+        if results is None:
+            raise NotFoundError("No such job history item exists")
+        session.delete(results)
+        _invalidate_caches(session)
+        session.commit()
 
     @staticmethod
-    def upsert_job_detail(job_detail: models.JobDetail) -> models.JobDetail:
+    def upsert_job_detail(
+        session: Session, job_detail: models.JobDetail
+    ) -> models.JobDetail:
         """
         Create a new job detail.
 
+        :param session: An open database session
+        :type session: Session
         :param job_detail: Details to add to a job
         :type job_detail: schema.JobDetail
         :return: Updated job details
         :rtype: schema.JobDetail
         """
-        with Session(models.engine) as session:
-            statement = select(models.JobDetail).where(
-                models.JobDetail.id == job_detail.id
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                results = job_detail
-            for key, value in job_detail.dict(exclude_unset=True).items():
-                setattr(results, key, value)
-            session.add(results)
-            session.commit()
-            session.refresh(results)
-            return results
+        inserted = _upsert(
+            session, models.JobDetail, job_detail.dict(exclude_unset=True), "id"
+        )
+        job_detail_id = job_detail.id or inserted.inserted_primary_key[0]
+        _invalidate_caches(session)
+        session.commit()
+        return session.get(models.JobDetail, job_detail_id)
 
     @staticmethod
-    def delete_job_detail(job_detail_id: int) -> None:
+    def delete_job_detail(session: Session, job_detail_id: int) -> None:
         """
         Remove a job detail with the given ID.
 
+        :param session: An open database session
+        :type session: Session
         :param job_detail_id: The ID of the job detail to remove
         :type job_detail_id: int
+        :raises NotFoundError: The requested job detail does not exist.
         """
-        with Session(models.engine) as session:
-            results = session.get(models.JobDetail, job_detail_id)
-            if not results:
-                raise KeyError("The requested job detail does not exist")
-            session.delete(results)
-            session.commit()
+        results = session.get(models.JobDetail, job_detail_id)
+        if not results:
+            raise NotFoundError("No such job detail item exists")
+        session.delete(results)
+        _invalidate_caches(session)
+        session.commit()
 
     @staticmethod
-    def upsert_job_highlight(job_highlight: models.JobHighlight) -> models.JobHighlight:
+    def upsert_job_highlight(
+        session: Session, job_highlight: models.JobHighlight
+    ) -> models.JobHighlight:
         """
         Create or updates a job highlight.
 
+        :param session: An open database session
+        :type session: Session
         :param job_highlight: A highlight to add to a job
         :type job_highlight: models.JobHighlight
         :return: The updated job highlight
         :rtype: models.JobHighlight
         """
-        with Session(models.engine) as session:
-            statement = select(models.JobHighlight).where(
-                models.JobHighlight.id == job_highlight.id
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                results = job_highlight
-            print(results)
-            for key, value in job_highlight.dict(exclude_unset=True).items():
-                setattr(results, key, value)
-            session.add(results)
-            session.commit()
-            session.refresh(results)
-            return results
+        inserted = _upsert(
+            session, models.JobHighlight, job_highlight.dict(exclude_unset=True), "id"
+        )
+        job_highlight_id = job_highlight.id or inserted.inserted_primary_key[0]
+        _invalidate_caches(session)
+        session.commit()
+        return session.get(models.JobHighlight, job_highlight_id)
 
     @staticmethod
-    def delete_job_highlight(job_highlight_id: int) -> None:
+    def delete_job_highlight(session: Session, job_highlight_id: int) -> None:
         """
         Remove a job highlight with the given ID.
 
+        :param session: An open database session
+        :type session: Session
         :param job_highlight_id: The ID of the job highlight to remove
         :type job_highlight_id: int
+        :raises NotFoundError: The requested job highlight does not exist.
         """
-        with Session(models.engine) as session:
-            results = session.get(models.JobHighlight, job_highlight_id)
-            if results is None:
-                raise KeyError("The requested job highlight does not exist")
-            session.delete(results)
-            session.commit()
+        results = session.get(models.JobHighlight, job_highlight_id)
+        if results is None:
+            raise NotFoundError("No such job highlight item exists")
+        session.delete(results)
+        _invalidate_caches(session)
+        session.commit()
 
     @staticmethod
-    def get_all_preferences() -> models.Preferences:
+    @_cached_section("preferences")
+    def get_all_preferences(session: Session) -> models.Preferences:
         """
         Retrieve all preferences stored in the database.
 
+        :param session: An open database session
+        :type session: Session
         :return: k/v pairs of all preferences and values
         :rtype: models.Preferences
         """
-        with Session(models.engine) as session:
-            statement = select(models.Preference)
-            results = session.exec(statement).all()
-            model = dict()
-            for result in results:
-                try:
-                    model[result.preference] = ast.literal_eval(result.value)
-                except (ValueError, SyntaxError):
-                    model[result.preference] = result.value
-            resp = models.Preferences.parse_obj(model)
-            return resp
+        model = {
+            preference: _parse_value(value)
+            for preference, value in session.execute(_SELECT_ALL_PREFERENCES)
+        }
+        resp = models.Preferences.parse_obj(model)
+        return resp
 
     @staticmethod
-    def get_preference(preference: str) -> models.Preference:
+    @_cached_section("preferences")
+    def get_preference(session: Session, preference: str) -> models.Preference:
         """
         Retrieve the value of a specified preference.
 
+        :param session: An open database session
+        :type session: Session
         :param preference: The title of a preference (e.g. `OS`)
         :type preference: str
         :return: The value of the requested preference
         :rtype: str
-        :raises KeyError: No value for the given preference is stored in the DB.
+        :raises NotFoundError: No value for the given preference is stored in the DB.
         """
-        with Session(models.engine) as session:
-            statement = select(models.Preference).where(
-                models.Preference.preference == preference
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError(f"No value for {preference} stored in the DB.")
-            return results
+        results = session.exec(
+            _SELECT_PREFERENCE, params={"preference": preference}
+        ).first()
+        if results is None:
+            raise NotFoundError(f"No value for {preference} stored in the DB.")
+        return results
 
     @staticmethod
-    def upsert_preference(preference: models.Preference) -> models.Preference:
+    def upsert_preference(
+        session: Session, preference: models.Preference
+    ) -> models.Preference:
         """
         Create or updates an existing preference.
 
+        :param session: An open database session
+        :type session: Session
         :param preference: A k/v pair of a preference and its value
         :type preference: schema.Preference
         ;return: The updated preference and value
         :rtype: models.Preference
         """
-        with Session(models.engine) as session:
-            statement = select(models.Preference).where(
-                models.Preference.preference == preference.preference
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                results = preference
-            for key, value in preference.dict(exclude_unset=True).items():
-                setattr(results, key, value)
-            session.add(results)
-            session.commit()
-            session.refresh(results)
-            return results
+        _upsert(
+            session,
+            models.Preference,
+            preference.dict(exclude_unset=True),
+            "preference",
+        )
+        _invalidate_caches(session)
+        session.commit()
+        return session.exec(
+            _SELECT_PREFERENCE, params={"preference": preference.preference}
+        ).one()
 
     @staticmethod
-    def delete_preference(preference: str) -> None:
+    def delete_preference(session: Session, preference: str) -> None:
         """
         Delete a preference item.
 
+        :param session: An open database session
+        :type session: Session
         :param preference: The name of the preference to be deleted
         :type preference: str
-        :raises KeyError: The requested preference does not exist.
+        :raises NotFoundError: The requested preference does not exist.
         """
-        with Session(models.engine) as session:
-            statement = select(models.Preference).where(
-                models.Preference.preference == preference
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested preference does not exist")
-            session.delete(results)
-            session.commit()
+        deleted = session.execute(
+            delete(models.Preference).where(models.Preference.preference == preference)
+        )
+        if not deleted.rowcount:
+            raise NotFoundError("No such preference exists")
+        _invalidate_caches(session)
+        session.commit()
 
     @staticmethod
+    @_cached_section("certifications")
     def get_certifications(
+        session: Session,
         valid_only: Optional[bool] = False,
-    ) -> List[models.Certification]:
+    ) -> List[dict]:
         """
         Retrieve all configured certifications.
 
         Can optionally filter to only currently-valid certifications.
 
+        :param session: An open database session
+        :type session: Session
         :param valid_only: Whether to limit the results to only currently-valid
             certifications, defaults to False
         :type valid_only: bool, optional
         :return: All certifications and their info
-        :rtype: List[schema.Certification]
+        :rtype: List[dict]
         """
-        with Session(models.engine) as session:
-            statement = select(models.Certification)
-            if valid_only:
-                statement = statement.where(models.Certification.valid)
-            results = session.exec(statement).all()
-            return results
+        statement = (
+            _SELECT_VALID_CERTIFICATIONS if valid_only else _SELECT_ALL_CERTIFICATIONS
+        )
+        results = [dict(row) for row in session.execute(statement).mappings()]
+        return results
 
     @staticmethod
-    def get_certification_by_name(certification: str) -> models.Certification:
+    @_cached_section("certifications")
+    def get_certification_by_name(
+        session: Session, certification: str
+    ) -> models.Certification:
         """
         Retrieve information about a specified certification.
 
+        :param session: An open database session
+        :type session: Session
         :param certification: The name of the certification
         :type certification: str
         :return: Information about the requested certification
         :rtype: schema.Certification
-        :raises KeyError: The certification does not exist in the DB.
+        :raises NotFoundError: The certification does not exist in the DB.
         """
-        with Session(models.engine) as session:
-            statement = select(models.Certification).where(
-                models.Certification.cert == certification
-            )
-            results = session.exec(statement).first()
-            if not results:
-                raise KeyError("Certification not implemented in the DB.")
-            return results
+        results = session.exec(
+            _SELECT_CERTIFICATION, params={"cert": certification}
+        ).first()
+        if not results:
+            raise NotFoundError(f"No certification item {certification}")
+        return results
 
     @staticmethod
     def upsert_certification(
+        session: Session,
         certification: models.Certification,
     ) -> models.Certification:
         """
         Create or update a certification.
 
+        :param session: An open database session
+        :type session: Session
         :param certification: A certification to update or add
         :type certification: schema.Certification
         :return: The updated certification details
         :rtype: schema.Certification
         """
-        with Session(models.engine) as session:
-            statement = select(models.Certification).where(
-                models.Certification.cert == certification.cert
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                results = certification
-            for key, value in certification.dict(exclude_unset=True).items():
-                setattr(results, key, value)
-            session.add(results)
-            session.commit()
-            session.refresh(results)
-            return results
+        _upsert(
+            session,
+            models.Certification,
+            certification.dict(exclude_unset=True),
+            "cert",
+        )
+        _invalidate_caches(session)
+        session.commit()
+        return session.exec(
+            _SELECT_CERTIFICATION, params={"cert": certification.cert}
+        ).one()
 
     @staticmethod
-    def delete_certification(cert: str) -> None:
+    def delete_certification(session: Session, cert: str) -> None:
         """
         Remove a certification by its name.
 
+        :param session: An open database session
+        :type session: Session
         :param cert: The name of the certification to remove
         :type cert: str
-        :raises KeyError: The requested certification does not exist
+        :raises NotFoundError: The requested certification does not exist
         """
-        with Session(models.engine) as session:
-            statement = select(models.Certification).where(
-                models.Certification.cert == cert
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested certification does not exist")
-            session.delete(results)
-            session.commit()
+        deleted = session.execute(
+            delete(models.Certification).where(models.Certification.cert == cert)
+        )
+        if not deleted.rowcount:
+            raise NotFoundError("No such certification exists")
+        _invalidate_caches(session)
+        session.commit()
 
     @staticmethod
-    def get_side_projects() -> List[models.SideProject]:
+    @_cached_section("side_projects")
+    def get_side_projects(session: Session) -> List[dict]:
         """
         Retrieve information about all side projects stored in the DB.
 
+        :param session: An open database session
+        :type session: Session
         :return: Info about each configured side project
-        :rtype: schema.SideProjects
+        :rtype: List[dict]
         """
-        with Session(models.engine) as session:
-            statement = select(models.SideProject)
-            results = session.exec(statement).all()
-            return results
+        results = [
+            dict(row) for row in session.execute(_SELECT_ALL_SIDE_PROJECTS).mappings()
+        ]
+        return results
 
     @staticmethod
-    def get_side_project(project: str) -> models.SideProject:
+    @_cached_section("side_projects")
+    def get_side_project(session: Session, project: str) -> models.SideProject:
         """
         Retrieve information about the requested side project.
 
+        :param session: An open database session
+        :type session: Session
         :param project: The title of the project to look up
         :type project: str
         :return: Details about the requested project
         :rtype: schema.SideProject
-        :raises KeyError: The requested project does not exist in the DB
+        :raises NotFoundError: The requested project does not exist in the DB
         """
-        with Session(models.engine) as session:
-            statement = select(models.SideProject).where(
-                models.SideProject.title == project
-            )
-            results = session.exec(statement).first()
-            if not results:
-                raise KeyError("The requested project does not exist.")
-            return results
+        results = session.exec(_SELECT_SIDE_PROJECT, params={"title": project}).first()
+        if not results:
+            raise NotFoundError(f"No side project {project}")
+        return results
 
     @staticmethod
-    def upsert_side_project(side_project: models.SideProject) -> models.SideProject:
+    def upsert_side_project(
+        session: Session, side_project: models.SideProject
+    ) -> models.SideProject:
         """
         Insert or update project depending on whether it already has an entry.
 
+        :param session: An open database session
+        :type session: Session
         :param side_project: Details of the side project
         :type side_project: schema.SideProject
         :return: The updated or created side project
         :rtype: models.SideProject
         """
-        with Session(models.engine) as session:
-            statement = select(models.SideProject).where(
-                models.SideProject.title == side_project.title
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                results = side_project
-            for key, value in side_project.dict(exclude_unset=True).items():
-                setattr(results, key, value)
-            session.add(results)
-            session.commit()
-            session.refresh(results)
-            return results
+        _upsert(
+            session,
+            models.SideProject,
+            side_project.dict(exclude_unset=True),
+            "title",
+        )
+        _invalidate_caches(session)
+        session.commit()
+        return session.exec(
+            _SELECT_SIDE_PROJECT, params={"title": side_project.title}
+        ).one()
 
     @staticmethod
-    def delete_side_project(title: str) -> None:
+    def delete_side_project(session: Session, title: str) -> None:
         """
         Delete a side project given the title of the project.
 
+        :param session: An open database session
+        :type session: Session
         :param title: The title of the project.
         :type title: str
-        :raises KeyError: The requested side project does not exist.
+        :raises NotFoundError: The requested side project does not exist.
         """
-        with Session(models.engine) as session:
-            statement = select(models.SideProject).where(
-                models.SideProject.title == title
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested side project does not exist")
-            session.delete(results)
-            session.commit()
+        deleted = session.execute(
+            delete(models.SideProject).where(models.SideProject.title == title)
+        )
+        if not deleted.rowcount:
+            raise NotFoundError("No such side project exists")
+        _invalidate_caches(session)
+        session.commit()
 
     @staticmethod
-    def get_interests_by_category(category: str) -> List[models.Interest]:
+    @_cached_section("interests")
+    def get_interests_by_category(session: Session, category: str) -> List[dict]:
         """
         Retrieve a list of all configured technical interests.
 
+        :param session: An open database session
+        :type session: Session
         :param category: The category of interest to return
         :type category: str
         :return: All configured interests of the requested category
-        :rtype: dict
+        :rtype: List[dict]
         """
-        with Session(models.engine) as session:
-            statement = (
-                select(models.Interest)
-                .join(models.InterestType, isouter=True)
-                .where(models.InterestType.interest_type == category)
-            )
-            results = session.exec(statement).all()
+        rows = session.execute(
+            _SELECT_INTERESTS_BY_TYPE, params={"interest_type": category}
+        ).mappings()
+        results = [dict(row) for row in rows]
         return results
 
     @staticmethod
     def upsert_interest(
-        category: models.InterestTypes, interest: str
+        session: Session, category: models.InterestTypes, interest: str
     ) -> models.Interest:
         """
         Add a new interest.
 
+        :param session: An open database session
+        :type session: Session
         :param category: The category of the interest
         :type category: str
         :param interest: The value of the interest
@@ -814,281 +1417,389 @@ class ResumeController:
         :return: The updated or created interest
         :rtype: models.Interest
         """
-        with Session(models.engine) as session:
-            type_statement = select(models.InterestType).where(
-                models.InterestType.interest_type == category
-            )
-            category_id = session.exec(type_statement).one()
-            interest_statement = select(models.Interest).where(
-                models.Interest.interest == interest
-            )
-            results = session.exec(interest_statement).first()
-            if results is None:
-                results = models.Interest()
-            setattr(results, "interest", interest)
-            setattr(results, "interest_type_id", category_id.id)
-            session.add(results)
-            session.commit()
-            session.refresh(results)
-            return results
+        category_id = session.exec(
+            _SELECT_INTEREST_TYPE, params={"interest_type": category}
+        ).one()
+        results = session.exec(_SELECT_INTEREST, params={"interest": interest}).first()
+        if results is None:
+            results = models.Interest()
+        setattr(results, "interest", interest)
+        setattr(results, "interest_type_id", category_id.id)
+        session.add(results)
+        _invalidate_caches(session)
+        session.commit()
+        return results
 
     @staticmethod
-    def delete_interest(interest: str) -> None:
+    def delete_interest(session: Session, interest: str) -> None:
         """
         Delete an interest.
 
+        :param session: An open database session
+        :type session: Session
         :param interest: The interest to remove
         :type interest: str
-        :raises KeyError: The requested interest does not exist.
+        :raises NotFoundError: The requested interest does not exist.
         """
-        with Session(models.engine) as session:
-            statement = select(models.Interest).where(
-                models.Interest.interest == interest
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested interest does not exist")
-            session.delete(results)
-            session.commit()
+        deleted = session.execute(
+            delete(models.Interest).where(models.Interest.interest == interest)
+        )
+        if not deleted.rowcount:
+            raise NotFoundError("No such interest exists")
+        _invalidate_caches(session)
+        session.commit()
 
-    @classmethod
-    def get_all_interests(cls) -> models.InterestsResponse:
+    @staticmethod
+    @_cached_section("interests")
+    def get_all_interests(session: Session) -> models.InterestsResponse:
         """
         Retrieve all interests personal and technical.
 
+        :param session: An open database session
+        :type session: Session
         :return: All interests
         :rtype: dict
         """
-        results = models.InterestsResponse(
-            personal=[
-                i.interest
-                for i in ResumeController.get_interests_by_category("personal")
-            ],
-            technical=[
-                i.interest
-                for i in ResumeController.get_interests_by_category("technical")
-            ],
-        )
+        interests = {category.value: [] for category in models.InterestTypes}
+        for interest, category in session.execute(_SELECT_ALL_INTERESTS):
+            if category in interests:
+                interests[category].append(interest)
+        results = models.InterestsResponse(**interests)
         return results
 
     @staticmethod
-    def get_social_links() -> List[models.SocialLink]:
+    @_cached_section("social_links")
+    def get_social_links(session: Session) -> List[dict]:
         """
         Retrieve all social links.
 
+        :param session: An open database session
+        :type session: Session
         :return: Links to all configured social platforms.
-        :rtype: dict
+        :rtype: List[dict]
         """
-        with Session(models.engine) as session:
-            statement = select(models.SocialLink)
-            results = session.exec(statement).all()
-            return results
+        results = [
+            dict(row) for row in session.execute(_SELECT_ALL_SOCIAL_LINKS).mappings()
+        ]
+        return results
 
     @staticmethod
-    def get_social_link(platform: str) -> models.SocialLink:
+    @_cached_section("social_links")
+    def get_social_link(session: Session, platform: str) -> models.SocialLink:
         """
         Retrieve a link to the requested social platform.
 
+        :param session: An open database session
+        :type session: Session
         :param platform: The desired social platform whose link to return
         :type platform: str
         :return: A link to the requested platform.
         :rtype: schema.SocialLink
-        :raises KeyError: The requested platform is not configured.
+        :raises NotFoundError: The requested platform is not configured.
         """
-        with Session(models.engine) as session:
-            statement = select(models.SocialLink).where(
-                models.SocialLink.platform == platform
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested platform is not configured")
-            return results
+        results = session.exec(
+            _SELECT_SOCIAL_LINK, params={"platform": platform}
+        ).first()
+        if results is None:
+            raise NotFoundError(f"No link stored for {platform}")
+        return results
 
     @staticmethod
-    def upsert_social_link(social_link: models.SocialLink) -> models.SocialLink:
+    def upsert_social_link(
+        session: Session, social_link: models.SocialLink
+    ) -> models.SocialLink:
         """
         Add or update a social link.
 
+        :param session: An open database session
+        :type session: Session
         :param social_link: Info for a social platform
         :type social_link: models.SocialLink
         :returns: The updated configuration for the social platform
         :rtype models.SocialLink:
         """
-        with Session(models.engine) as session:
-            statement = select(models.SocialLink).where(
-                models.SocialLink.platform == social_link.platform
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                results = social_link
-            for key, value in social_link.dict(exclude_unset=True).items():
-                setattr(results, key, value)
-            session.add(results)
+        updated = session.execute(
+            update(models.SocialLink)
+            .where(models.SocialLink.platform == social_link.platform)
+            .values(**social_link.dict(exclude_unset=True, exclude={"id"}))
+        )
+        if not updated.rowcount:
+            session.add(social_link)
+            _invalidate_caches(session)
             session.commit()
-            session.refresh(results)
-            return results
+            return social_link
+        _invalidate_caches(session)
+        session.commit()
+        return session.exec(
+            _SELECT_SOCIAL_LINK, params={"platform": social_link.platform}
+        ).first()
 
     @staticmethod
-    def delete_social_link(platform: str) -> None:
+    def delete_social_link(session: Session, platform: str) -> None:
         """
         Remove a social link given the platform.
 
+        :param session: An open database session
+        :type session: Session
         :param platform: The name of the social platform to remove
         :type platform: str
-        :raises KeyError: The requested platform does not exist
+        :raises NotFoundError: The requested platform does not exist
         """
-        with Session(models.engine) as session:
-            statement = select(models.SocialLink).where(
-                models.SocialLink.platform == platform
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested platform does not exist")
-            session.delete(results)
-            session.commit()
+        deleted = session.execute(
+            delete(models.SocialLink).where(models.SocialLink.platform == platform)
+        )
+        if not deleted.rowcount:
+            raise NotFoundError("No such social link exists")
+        _invalidate_caches(session)
+        session.commit()
 
     @staticmethod
-    def get_skills() -> List[models.Skill]:
+    @_cached_section("skills")
+    def get_skills(session: Session) -> List[dict]:
         """
         Retrieve a list of all configured skills.
 
+        :param session: An open database session
+        :type session: Session
         :return: All configured skills and their respective details
-        :rtype: dict
+        :rtype: List[dict]
         """
-        with Session(models.engine) as session:
-            statement = select(models.Skill)
-            results = session.exec(statement).all()
+        results = [dict(row) for row in session.execute(_SELECT_ALL_SKILLS).mappings()]
         return results
 
     @staticmethod
-    def get_skill(skill: str) -> models.Skill:
+    @_cached_section("skills")
+    def get_skill(session: Session, skill: str) -> models.Skill:
         """
         Retrieve details about the requested skill.
 
+        :param session: An open database session
+        :type session: Session
         Args:
             skill: A string specifying the desired skill
         :return: Details about the requested skill
         :rtype: dict
-        :raises KeyError: The requested skill is not listed
+        :raises NotFoundError: The requested skill is not listed
         """
-        with Session(models.engine) as session:
-            statement = select(models.Skill).where(models.Skill.skill == skill)
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested skill does not exist (yet!)")
-            return results
+        results = session.exec(_SELECT_SKILL, params={"skill": skill}).first()
+        if results is None:
+            raise NotFoundError(f"The requested skill {skill} does not exist (yet!)")
+        return results
 
     @staticmethod
-    def upsert_skill(skill: models.Skill) -> models.Skill:
+    def upsert_skill(session: Session, skill: models.Skill) -> models.Skill:
         """
         Create a new skill or updates an existing skill.
 
+        :param session: An open database session
+        :type session: Session
         :param skill: Details of the skill to update or add
         :type: schema.Skill
         :return: Details about the updated skill
         :rtype: models.Skill
         """
-        with Session(models.engine) as session:
-            statement = select(models.Skill).where(models.Skill.skill == skill.skill)
-            results = session.exec(statement).first()
-            if results is None:
-                results = skill
-            for key, value in skill.dict(exclude_unset=True).items():
-                setattr(results, key, value)
-            session.add(results)
+        updated = session.execute(
+            update(models.Skill)
+            .where(models.Skill.skill == skill.skill)
+            .values(**skill.dict(exclude_unset=True, exclude={"id"}))
+        )
+        if not updated.rowcount:
+            session.add(skill)
+            _invalidate_caches(session)
             session.commit()
-            session.refresh(results)
-            return results
+            return skill
+        _invalidate_caches(session)
+        session.commit()
+        return session.exec(_SELECT_SKILL, params={"skill": skill.skill}).first()
 
     @staticmethod
-    def delete_skill(skill: str) -> None:
+    def delete_skill(session: Session, skill: str) -> None:
         """
         Delete a Skill.
 
+        :param session: An open database session
+        :type session: Session
         :param skill: The name of the skill to remove
         :type skill: str
-        :raises KeyError: The requested skill does not exist
+        :raises NotFoundError: The requested skill does not exist
         """
-        with Session(models.engine) as session:
-            statement = select(models.Skill).where(models.Skill.skill == skill)
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested skill does not exist")
-            session.delete(results)
-            session.commit()
+        deleted = session.execute(
+            delete(models.Skill).where(models.Skill.skill == skill)
+        )
+        if not deleted.rowcount:
+            raise NotFoundError("No such skill exists")
+        _invalidate_caches(session)
+        session.commit()
 
     @staticmethod
-    def get_competencies() -> List[models.Competency]:
+    @_cached_section("competencies")
+    def get_competencies(session: Session) -> List[dict]:
         """
         Retrieve a list of configured competencies.
 
+        :param session: An open database session
+        :type session: Session
         :return: All configured competencies.
+        :rtype: List[dict]
+        """
+        results = [
+            dict(row) for row in session.execute(_SELECT_ALL_COMPETENCIES).mappings()
+        ]
+        return results
+
+    @staticmethod
+    def _get_competency_names(session: Session) -> List[str]:
+        """
+        Retrieve only the names of the configured competencies.
+
+        :param session: An open database session
+        :type session: Session
+        :return: The name of each configured competency
         :rtype: list
         """
-        with Session(models.engine) as session:
-            statement = select(models.Competency)
-            results = session.exec(statement).all()
-            return results
+        return session.execute(_SELECT_COMPETENCY_NAMES).scalars().all()
 
     @staticmethod
-    def upsert_competency(competency: str) -> models.Competency:
+    def upsert_competency(session: Session, competency: str) -> models.Competency:
         """
         Create a new competency.
 
+        :param session: An open database session
+        :type session: Session
         :param competency: The competency to add
         :type competency: str
         :return: The updated competency
         :rtype: dict
         """
-        with Session(models.engine) as session:
-            statement = select(models.Competency).where(
-                models.Competency.competency == competency
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                results = models.Competency(competency=competency)
-            session.add(results)
-            session.commit()
-            session.refresh(results)
-            return results
+        inserted = session.execute(
+            _insert(models.Competency)
+            .values(competency=competency)
+            .on_conflict_do_nothing(index_elements=["competency"])
+        )
+        if inserted.rowcount:
+            _invalidate_caches(session)
+        session.commit()
+        return session.exec(_SELECT_COMPETENCY, params={"competency": competency}).one()
 
     @staticmethod
-    def delete_competency(competency: str) -> None:
+    def delete_competency(session: Session, competency: str) -> None:
         """
         Remove a competency string.
 
+        :param session: An open database session
+        :type session: Session
         :param competency: The competency to remove
         :param competency: str
-        :raises KeyError: The requested competency does not exist.
+        :raises NotFoundError: The requested competency does not exist.
         """
-        with Session(models.engine) as session:
-            statement = select(models.Competency).where(
-                models.Competency.competency == competency
-            )
-            results = session.exec(statement).first()
-            if results is None:
-                raise KeyError("The requested competency does not exist")
-            session.delete(results)
-            session.commit()
+        deleted = session.execute(
+            delete(models.Competency).where(models.Competency.competency == competency)
+        )
+        if not deleted.rowcount:
+            raise NotFoundError("No such competency exists")
+        _invalidate_caches(session)
+        session.commit()
+
+    @staticmethod
+    def clear_caches(session: Session) -> None:
+        """
+        Drop every cached read, including the stored full resume.
+
+        Used after the database has been changed outside of the API.
+
+        :param session: An open database session
+        :type session: Session
+        """
+        session.execute(
+            update(models.ResumeCache)
+            .where(models.ResumeCache.id == RESUME_CACHE_ID)
+            .values(payload=None, version=models.ResumeCache.version + 1)
+        )
+        session.commit()
+        with _read_cache_lock:
+            _read_cache.clear()
+
+    @staticmethod
+    def get_rendered(session: Session, render: Callable, getter: Callable, *args):
+        """
+        Retrieve a cached getter's result in rendered form, caching the rendering.
+
+        The rendering is cached alongside the getter's own result, so it is replaced
+        as soon as any part of the resume is written.
+
+        :param session: An open database session
+        :type session: Session
+        :param render: Converts the getter's result into its rendered form
+        :type render: Callable
+        :param getter: A resume getter cached by section
+        :type getter: Callable
+        :param args: Arguments passed on to the getter
+        :return: The rendered result of the getter
+        :raises NotFoundError: The getter found no matching item.
+        """
+        return _read_through(
+            session,
+            (getter.section, getter.__name__, render.__name__, *args),
+            lambda: render(getter(session, *args)),
+        )
 
     @classmethod
-    def get_full_resume(cls) -> models.FullResume:
+    def get_full_resume(cls, session: Session) -> models.FullResume:
         """
         Assemble all elements of the resume into a single response.
 
+        :param session: An open database session
+        :type session: Session
         :return: All elements of the resume
         :rtype: modes.FullResume
         """
-        response = models.FullResume(
-            basic_info=ResumeController.get_basic_info(),
-            experience=ResumeController.get_experience(),
-            education=ResumeController.get_all_education_history(),
-            certifications=ResumeController.get_certifications(),
-            side_projects=ResumeController.get_side_projects(),
-            interests=ResumeController.get_all_interests(),
-            social_links=ResumeController.get_social_links(),
-            skills=ResumeController.get_skills(),
-            preferences=ResumeController.get_all_preferences(),
-            competencies=ResumeController.get_competencies(),
+        # Each section is fetched with a fixed number of queries regardless of how
+        # many rows it holds (e.g. job details and highlights are selectin-loaded),
+        # so keep any new sections batched the same way. Every section is already
+        # built from validated models, so the response is constructed without
+        # validating it a second time. The in-memory section caches are bypassed
+        # since the result is stored against the current ResumeCache version.
+        response = models.FullResume.construct(
+            basic_info=ResumeController.get_basic_info.__wrapped__(session),
+            experience=ResumeController.get_experience.__wrapped__(session),
+            education=ResumeController.get_all_education_history.__wrapped__(session),
+            certifications=ResumeController.get_certifications.__wrapped__(session),
+            side_projects=ResumeController.get_side_projects.__wrapped__(session),
+            interests=ResumeController.get_all_interests.__wrapped__(session),
+            social_links=ResumeController.get_social_links.__wrapped__(session),
+            skills=ResumeController.get_skills.__wrapped__(session),
+            preferences=ResumeController.get_all_preferences.__wrapped__(session),
+            competencies=ResumeController._get_competency_names(session),
         )
         return response
+
+    @classmethod
+    def get_full_resume_json(cls, session: Session) -> str:
+        """
+        Retrieve the full resume already serialized to JSON.
+
+        The serialized resume is stored in the database and reused until a write to
+        any section clears it, at which point it is rebuilt on the next read. A read
+        that rebuilds the resume therefore writes the new payload back and commits
+        the session. The payload is only stored if the version of the cache row is
+        unchanged since the read began, so a write committed in the meantime is never
+        masked by a stale payload.
+
+        :param session: An open database session
+        :type session: Session
+        :return: All elements of the resume as a JSON document
+        :rtype: str
+        """
+        cache = session.get(models.ResumeCache, RESUME_CACHE_ID)
+        if cache is not None and cache.payload is not None:
+            return cache.payload
+        payload = ResumeController.get_full_resume(session).json(separators=(",", ":"))
+        if cache is not None:
+            session.execute(
+                update(models.ResumeCache)
+                .where(models.ResumeCache.id == RESUME_CACHE_ID)
+                .where(models.ResumeCache.version == cache.version)
+                .values(payload=payload)
+            )
+            session.commit()
+        return payload
@@ -3,71 +3,341 @@
 # pylint: disable=too-many-lines
 
 from datetime import timedelta
+import hashlib
 import os
 import logging
 from typing import List, Optional
 
 from dotenv import load_dotenv
-from fastapi import Body, Depends, FastAPI, HTTPException, status
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    ORJSONResponse,
+    RedirectResponse,
+)
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt  # noqa
-import uvicorn
+import jwt
+import orjson
+from pydantic import BaseModel
+from sqlmodel import Session
+from starlette.datastructures import MutableHeaders
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from resumeapi import __version__
-from resumeapi.controller import AuthController, ResumeController
+from resumeapi.controller import (
+    AuthController,
+    NotFoundError,
+    ResumeController,
+    get_session,
+)
 from resumeapi import models
 
 load_dotenv()
-app = FastAPI(title="Resume API", version=__version__.__version__)
+ACCESS_TOKEN_EXPIRES = timedelta(
+    minutes=int(os.getenv("ACCESS_TOKEN_EXPIRES_MINUTES", default="5"))
+)
+
+
+class ResumeGZipMiddleware(GZipMiddleware):  # pylint: disable=too-few-public-methods
+    """Compress responses, except those under paths that are already compressed."""
+
+    def __init__(  # pylint: disable=redefined-outer-name
+        self, app: ASGIApp, exclude_paths: frozenset, **kwargs
+    ) -> None:
+        """
+        Set up compression for every path but the excluded ones.
+
+        :param app: The application whose responses to compress
+        :type app: ASGIApp
+        :param exclude_paths: Paths whose responses are sent as-is
+        :type exclude_paths: frozenset
+        """
+        super().__init__(app, **kwargs)
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Compress the response if the client accepts it and the path allows it.
+
+        A compressed body differs byte for byte from the uncompressed one, so its
+        ETag is marked weak rather than reused as a strong validator.
+
+        :param scope: The connection scope
+        :type scope: Scope
+        :param receive: Receives messages from the client
+        :type receive: Receive
+        :param send: Sends messages to the client
+        :type send: Send
+        """
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_weak_etag(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                etag = headers.get("etag")
+                if etag and "content-encoding" in headers and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+            await send(message)
+
+        await super().__call__(scope, receive, send_with_weak_etag)
+
+
+app = FastAPI(
+    title="Resume API",
+    version=__version__.__version__,
+    default_response_class=ORJSONResponse,
+)
+# The PDF is compressed already, so gzip would only cost CPU and break its ETag
+app.add_middleware(
+    ResumeGZipMiddleware,
+    exclude_paths=frozenset({"/pdf"}),
+    minimum_size=512,
+    compresslevel=5,
+)
 resume = ResumeController()
 auth_control = AuthController()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 logger = logging.getLogger(__name__)
+RESUME_PDF = "ericrochowresume.pdf"
+PDF_CACHE_CONTROL = "public, max-age=3600"
+RESPONSE_CACHE_CONTROL = "public, max-age=60"
+# A redirect has no body or ETag for middleware to rewrite, so one instance is shared
+HTML_REDIRECT = RedirectResponse("https://resume.ericroc.how")
+# The PDF is hashed and stat'ed once at startup; responses are still built per
+# request, since middleware such as GZip rewrites their headers in place.
+app.state.pdf_stat = None
+app.state.pdf_etag = None
+# Starlette only reads the exception when rendering it, so one instance is shared
+CREDENTIALS_EXCEPTION = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
+def etag_matches(request: Request, etag: str) -> bool:
     """
-    Validate a JWT token and identifies the currently-authenticated user.
+    Determine whether the client already holds the representation with this ETag.
 
-    :param  token: A string containing a full JWT token.
-    :type token: str
-    :return: A string containing the username authenticated user.
-    :rtype: str
-    :raises HttpException: Could not validate credentials.
-    """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
+    :param request: The incoming request
+    :type request: Request
+    :param etag: The quoted ETag of the current representation
+    :type etag: str
+    :return: Whether If-None-Match lists the ETag (or is a wildcard)
+    :rtype: bool
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def render_json(content) -> tuple:
+    """
+    Serialize a response body to JSON and derive its ETag.
+
+    :param content: The response body
+    :return: The serialized body and its quoted ETag
+    :rtype: tuple
+    """
+    payload = orjson.dumps(jsonable_encoder(content))
+    return payload, f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+
+def cached_json_response(request: Request, session: Session, getter, *args) -> Response:
+    """
+    Respond with a cached getter's result, serialized once and reused until it changes.
+
+    :param request: The incoming request
+    :type request: Request
+    :param session: An open database session
+    :type session: Session
+    :param getter: The resume getter whose result to send
+    :param args: Arguments identifying the item to send, if any
+    :return: The serialized result, or an empty 304 if the client already has it
+    :rtype: Response
+    :raises NotFoundError: The getter found no matching item.
+    """
+    payload, etag = resume.get_rendered(session, render_json, getter, *args)
+    headers = {"ETag": etag, "Cache-Control": RESPONSE_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+@app.exception_handler(NotFoundError)
+async def not_found_handler(
+    request: Request, exc: NotFoundError  # pylint: disable=unused-argument
+) -> ORJSONResponse:
+    """
+    Answer with a 404 when the controller cannot find the requested item.
+
+    :param request: The request that failed
+    :type request: Request
+    :param exc: The error raised by the controller
+    :type exc: NotFoundError
+    :return: A 404 response carrying the controller's message
+    :rtype: ORJSONResponse
+    """
+    detail = exc.args[0] if exc.args else "Not found"
+    return ORJSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND, content={"detail": detail}
     )
-    try:
-        payload = jwt.decode(
-            token, os.getenv("SECRET_KEY"), algorithms=[os.getenv("ALGORITHM")]
-        )
-        username: str = payload.get("sub")
-        if not username:
-            raise credentials_exception
-    except JWTError as exc:
-        raise credentials_exception from exc
-    user = auth_control.get_user(username)
-    if not user:
-        raise credentials_exception
-    return user
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException  # pylint: disable=unused-argument
+) -> Response:
+    """
+    Render HTTP errors with orjson instead of the stdlib JSON encoder.
+
+    :param request: The request that failed
+    :type request: Request
+    :param exc: The HTTP error raised while handling the request
+    :type exc: StarletteHTTPException
+    :return: The error response
+    :rtype: Response
+    """
+    headers = getattr(exc, "headers", None)
+    if exc.status_code < 200 or exc.status_code in (204, 304):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse(
+        status_code=exc.status_code, content={"detail": exc.detail}, headers=headers
+    )
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(
+    request: Request, exc: RequestValidationError  # pylint: disable=unused-argument
+) -> ORJSONResponse:
+    """
+    Render request validation errors with orjson instead of the stdlib JSON encoder.
+
+    :param request: The request that failed validation
+    :type request: Request
+    :param exc: The validation error
+    :type exc: RequestValidationError
+    :return: A 422 response listing the validation errors
+    :rtype: ORJSONResponse
+    """
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors())},
+    )
+
+
+class PydanticResponse(JSONResponse):
+    """Render a pydantic model with its own JSON encoder."""
+
+    def render(self, content: BaseModel) -> bytes:
+        """
+        Serialize the model without passing it through jsonable_encoder first.
+
+        :param content: The model to serialize
+        :type content: BaseModel
+        :return: The encoded JSON body
+        :rtype: bytes
+        """
+        return content.json(by_alias=True, exclude_none=True).encode()
+
+
+@app.on_event("startup")
+def check_auth_settings() -> None:
+    """
+    Refuse to start without the settings needed to sign access tokens.
+
+    :raises RuntimeError: SECRET_KEY or ALGORITHM is not set.
+    """
+    if not auth_control.secret_key or not auth_control.algorithm:
+        raise RuntimeError("SECRET_KEY and ALGORITHM must both be set")
+
+
+@app.on_event("startup")
+def load_resume_pdf() -> None:
+    """Hash and stat the resume PDF once, if it is present."""
+    if os.path.isfile(RESUME_PDF):
+        with open(RESUME_PDF, "rb") as pdf:
+            digest = hashlib.blake2b(pdf.read(), digest_size=8).hexdigest()
+        app.state.pdf_stat = os.stat(RESUME_PDF)
+        app.state.pdf_etag = f'"{digest}"'
+    else:
+        logger.warning("No resume PDF found at %s", RESUME_PDF)
+
+
+@app.on_event("startup")
+def warm_resume_caches() -> None:
+    """
+    Load the cached resume sections so that early requests are served from memory.
+
+    Sections that cannot be built yet (e.g. on an empty database) are skipped and
+    built on their first request instead.
+    """
+    loaders = (
+        resume.get_basic_info,
+        resume.get_experience,
+        resume.get_all_preferences,
+        resume.get_certifications,
+        resume.get_side_projects,
+        resume.get_all_interests,
+        resume.get_social_links,
+        resume.get_skills,
+        resume.get_competencies,
+        resume.get_full_resume_json,
+    )
+    preloads = [(loader, ()) for loader in loaders] + [
+        (resume.get_interests_by_category, (category.value,))
+        for category in models.InterestTypes
+    ]
+    with models.SessionLocal() as session:
+        for loader, args in preloads:
+            try:
+                loader(session, *args)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Could not preload %s%s", loader.__name__, args, exc_info=True
+                )
+                session.rollback()
 
 
 async def get_current_active_user(
-    current_user: models.User = Depends(get_current_user),
-):
+    token: str = Depends(oauth2_scheme),
+) -> models.User:
     """
-    Determine whether the currently-authenticated user is disabled or active.
+    Identify the currently-authenticated user from their JWT and check they are active.
 
-    :param current_user: The user to check for disabled status
-    :type current_user: models.User
-    :return: The same object passed in
+    :param token: A string containing a full JWT token.
+    :type token: str
+    :return: The authenticated user
     :rtype: models.User
-    :raises HttpException: The currently-active user is disabled.
-    """
+    :raises HttpException: Could not validate credentials, or the user is disabled.
+    """
+    current_user = auth_control.get_cached_token_user(token)
+    if current_user is None:
+        if auth_control.is_rejected_token(token):
+            raise CREDENTIALS_EXCEPTION
+        try:
+            current_user = await run_in_threadpool(auth_control.get_token_user, token)
+        except (KeyError, jwt.PyJWTError) as exc:
+            raise CREDENTIALS_EXCEPTION from exc
     if current_user.disabled:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
@@ -75,6 +345,10 @@ async def get_current_active_user(
     return current_user
 
 
+# Every route on this router requires an active, authenticated user
+auth_router = APIRouter(dependencies=[Depends(get_current_active_user)])
+
+
 @app.post(
     "/token",
     summary="Create an API token",
@@ -86,51 +360,65 @@ async def get_current_active_user(
     tags=["Authentication"],
 )
 async def login_for_access_token(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-) -> models.Token:
+) -> PydanticResponse:
     """
     Authenticate a user with Basic Auth and passes back a Bearer token.
 
+    :param request: The incoming request
+    :type request: Request
     :param form_data: An OAuth2PasswordRequest object containing Basic Auth credentials
     :type form_data: OAuth2PasswordRequestForm
     :return: The access token and token_type of "bearer".
     :rtype: dict
-    :raises HttpException: Incorrect username or password.
+    :raises HttpException: Incorrect username or password, or too many failed
+        attempts from this client for this user.
     """
-    logger.debug("Attempting to log in as user %s", form_data.username)
-    valid_user = auth_control.authenticate_user(form_data.username, form_data.password)
+    # Behind a trusted proxy, uvicorn sets this from X-Forwarded-For
+    client = request.client.host if request.client else ""
+    retry_after = auth_control.login_retry_after(client, form_data.username)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts.",
+            headers={"Retry-After": str(retry_after)},
+        )
+    try:
+        valid_user = await auth_control.authenticate_user(
+            form_data.username, form_data.password
+        )
+    except (KeyError, ValueError):
+        valid_user = None
     if not valid_user:
+        auth_control.record_login_failure(client, form_data.username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    max_token_expiration = int(os.getenv("ACCESS_TOKEN_EXPIRES_MINUTES", default="5"))
-    access_token_expires = timedelta(minutes=max_token_expiration)
     access_token = auth_control.create_access_token(
-        data={"sub": valid_user.username}, expires_delta=access_token_expires
+        data={"sub": valid_user.username}, expires_delta=ACCESS_TOKEN_EXPIRES
     )
-    response = models.Token(  # nosec: B106 - "bearer" is the type not the value
+    response = models.Token.construct(  # nosec: B106 - "bearer" is the type
         access_token=access_token, token_type="bearer"
     )
-    return response
+    return PydanticResponse(response, status_code=status.HTTP_201_CREATED)
 
 
 # GET methods for read-only operations
-@app.get(
+@auth_router.get(
     "/users",
     summary="List all users",
     response_description="All users",
     response_model=models.Users,
     tags=["Users"],
 )
-async def get_all_users(
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+def get_all_users(
+    session: Session = Depends(get_session),
 ):
     """List all users and wheter the user is active."""
-    return resume.get_all_users()
+    return resume.get_all_users(session)
 
 
 @app.get(
@@ -142,21 +430,33 @@ async def get_all_users(
 )
 async def read_users_me(
     current_user: models.User = Depends(get_current_active_user),
-):
+) -> PydanticResponse:
     """Return info about the currently-authenticated user."""
-    return {"username": current_user.username, "disabled": current_user.disabled}
+    return PydanticResponse(
+        models.User.construct(
+            username=current_user.username, disabled=current_user.disabled
+        )
+    )
 
 
 @app.get(
     "/",
     summary="Full resume in JSON format",
     response_description="Full resume in JSON format",
-    response_model=models.FullResume,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": models.FullResume}},
     tags=["Full Resume"],
 )
-async def get_full_resume() -> models.FullResume:
+def get_full_resume(
+    request: Request, session: Session = Depends(get_session)
+) -> Response:
     """Request a JSON representation of my full resume."""
-    return resume.get_full_resume()
+    payload = resume.get_full_resume_json(session).encode()
+    etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": RESPONSE_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
 @app.get(
@@ -165,16 +465,17 @@ async def get_full_resume() -> models.FullResume:
     status_code=status.HTTP_200_OK,
     tags=["Full Resume"],
 )
-async def get_resume_pdf() -> FileResponse:
+async def get_resume_pdf(request: Request) -> Response:
     """Request PDF of my full resume."""
-    pdf = "ericrochowresume.pdf"
-    try:
-        return FileResponse(pdf)
-    except RuntimeError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
+    if app.state.pdf_stat is None:
+        raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No file at this location",
         )
+    headers = {"ETag": app.state.pdf_etag, "Cache-Control": PDF_CACHE_CONTROL}
+    if etag_matches(request, app.state.pdf_etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(RESUME_PDF, stat_result=app.state.pdf_stat, headers=headers)
 
 
 @app.get(
@@ -187,212 +488,229 @@ async def get_resume_pdf() -> FileResponse:
 )
 async def get_resume_html() -> RedirectResponse:
     """Request HTML rendering of my resume."""
-    return RedirectResponse("https://resume.ericroc.how")
+    return HTML_REDIRECT
 
 
 @app.get(
     "/basic_info",
     summary="Request basic info about me",
     response_description="About Me",
-    response_model=models.BasicInfos,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": models.BasicInfos}},
     status_code=status.HTTP_200_OK,
     tags=["Basic Info"],
 )
-async def get_basic_info() -> models.BasicInfos:
+def get_basic_info(
+    request: Request, session: Session = Depends(get_session)
+) -> Response:
     """Gather basic details about me, such as contact info, pronouns, etc."""
-    return resume.get_basic_info()
+    return cached_json_response(request, session, resume.get_basic_info)
 
 
 @app.get(
     "/basic_info/{fact}",
     summary="Request a single basic info fact",
     response_description="Basic info fact",
-    response_model=models.BasicInfo,
-    responses={status.HTTP_404_NOT_FOUND: {"models": models.BasicInfo}},
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": models.BasicInfo},
+        status.HTTP_404_NOT_FOUND: {"models": models.BasicInfo},
+    },
     status_code=status.HTTP_200_OK,
     tags=["Basic Info"],
 )
-async def get_basic_info_fact(fact: str) -> models.BasicInfo:
+def get_basic_info_fact(
+    request: Request, fact: str, session: Session = Depends(get_session)
+) -> Response:
     """Find a single basic fact about me based on the specified fact key."""
-    try:
-        return resume.get_basic_info_item(fact)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No basic info item {fact}",
-        )
+    return cached_json_response(request, session, resume.get_basic_info_item, fact)
 
 
 @app.get(
     "/education",
     summary="Request my full education history",
     response_description="Education history",
-    response_model=List[models.Education],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[models.Education]}},
     status_code=status.HTTP_200_OK,
     tags=["Education"],
 )
-async def get_education() -> List[models.Education]:
+def get_education(
+    request: Request,
+    session: Session = Depends(get_session),
+) -> Response:
     """Find my full education history."""
-    return resume.get_all_education_history()
+    return cached_json_response(request, session, resume.get_all_education_history)
 
 
 @app.get(
     "/education/{index}",
     summary="Request a single education history item",
     response_description="Education history item",
-    response_model=models.Education,
-    responses={status.HTTP_404_NOT_FOUND: {"model": models.Education}},
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": models.Education},
+        status.HTTP_404_NOT_FOUND: {"model": models.Education},
+    },
     status_code=status.HTTP_200_OK,
     tags=["Education"],
 )
-async def get_education_item(index: int) -> models.Education:
+def get_education_item(
+    request: Request, index: int, session: Session = Depends(get_session)
+) -> Response:
     """
     Request a single education history item based on its ID.
 
     - **index**: ID of the education history item
     """
-    try:
-        return resume.get_education_item(index)
-    except IndexError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No education item {index}",
-        )
+    return cached_json_response(request, session, resume.get_education_item, index)
 
 
 @app.get(
     "/experience",
     summary="Request full job history",
     response_description="Job history",
-    response_model=List[models.JobResponse],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[models.JobResponse]}},
     status_code=status.HTTP_200_OK,
     tags=["Experience"],
 )
-async def get_experience() -> List[models.JobResponse]:
+def get_experience(
+    request: Request,
+    session: Session = Depends(get_session),
+) -> Response:
     """Request my full post-graduate job history."""
-    return resume.get_experience()
+    return cached_json_response(request, session, resume.get_experience)
 
 
 @app.get(
     "/experience/{index}",
     summary="Job history item",
     response_description="Job history item",
-    response_model=models.JobResponse,
-    responses={status.HTTP_404_NOT_FOUND: {"model": models.JobResponse}},
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": models.JobResponse},
+        status.HTTP_404_NOT_FOUND: {"model": models.JobResponse},
+    },
     status_code=status.HTTP_200_OK,
     tags=["Experience"],
 )
-async def get_experience_item(index: int) -> models.JobResponse:
+def get_experience_item(
+    request: Request, index: int, session: Session = Depends(get_session)
+) -> Response:
     """
     Find a single job history items specified by ID.
 
     - **index**: The ID of the job whose info to return
     """
-    try:
-        results = resume.get_experience_item(index)
-        return results
-        # return resume.get_experience_item(index)
-    except IndexError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No experience item {index}",
-        )
+    return cached_json_response(request, session, resume.get_experience_item, index)
 
 
 @app.get(
     "/certifications",
     summary="Certification list",
     response_description="Certifications",
-    response_model=List[models.Certification],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[models.Certification]}},
     status_code=status.HTTP_200_OK,
     tags=["Certifications"],
 )
-async def get_certification_history(
+def get_certification_history(
+    request: Request,
     valid_only: Optional[bool] = False,
-) -> List[models.Certification]:
+    session: Session = Depends(get_session),
+) -> Response:
     """
     Find my full list of current, previous, and in-progress certifications.
 
     - **valid_only**: Only include current certifications excluding expired ones
         (optional, defaults to False)
     """
-    certs = resume.get_certifications(valid_only=valid_only)
-    return certs
+    return cached_json_response(
+        request, session, resume.get_certifications, bool(valid_only)
+    )
 
 
 @app.get(
     "/certifications/{certification}",
     summary="Single certification",
     response_description="Certification",
-    response_model=models.Certification,
-    responses={status.HTTP_404_NOT_FOUND: {"model": models.Certification}},
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": models.Certification},
+        status.HTTP_404_NOT_FOUND: {"model": models.Certification},
+    },
     status_code=status.HTTP_200_OK,
     tags=["Certifications"],
 )
-async def get_certification_item(
-    certification: str,
-) -> models.Certification:
+def get_certification_item(
+    request: Request, certification: str, session: Session = Depends(get_session)
+) -> Response:
     """
     Find information about a single certification specified in the path.
 
     - **certification**: Case-sensitive certification name
     """
-    try:
-        return resume.get_certification_by_name(certification)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No certification item {certification}",
-        )
+    return cached_json_response(
+        request, session, resume.get_certification_by_name, certification
+    )
 
 
 @app.get(
     "/side_projects",
     summary="Side projects",
     response_description="Side projects",
-    response_model=List[models.SideProject],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[models.SideProject]}},
     status_code=status.HTTP_200_OK,
     tags=["Side Projects"],
 )
-async def get_side_projects() -> List[models.SideProject]:
+def get_side_projects(
+    request: Request,
+    session: Session = Depends(get_session),
+) -> Response:
     """Find a list of my highlighted side projects."""
-    return resume.get_side_projects()
+    return cached_json_response(request, session, resume.get_side_projects)
 
 
 @app.get(
     "/side_projects/{project}",
     summary="Single side project",
     response_description="Side project",
-    responses={status.HTTP_404_NOT_FOUND: {"models": models.SideProject}},
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": models.SideProject},
+        status.HTTP_404_NOT_FOUND: {"models": models.SideProject},
+    },
     status_code=status.HTTP_200_OK,
     tags=["Side Projects"],
 )
-async def get_side_project(project: str) -> models.SideProject:
+def get_side_project(
+    request: Request, project: str, session: Session = Depends(get_session)
+) -> Response:
     """
     Find a single side project specified by name.
 
     - **project**: The name of the project whose info to return.
     """
-    try:
-        return resume.get_side_project(project)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No side project {project}",
-        )
+    return cached_json_response(request, session, resume.get_side_project, project)
 
 
 @app.get(
     "/interests",
     summary="Interests",
     response_description="Interests",
-    response_model=models.InterestsResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": models.InterestsResponse}},
     status_code=status.HTTP_200_OK,
     tags=["Interests"],
 )
-async def get_all_interests() -> models.InterestsResponse:
+def get_all_interests(
+    request: Request,
+    session: Session = Depends(get_session),
+) -> Response:
     """Find all personal and technical/professional interests."""
-    return resume.get_all_interests()
+    return cached_json_response(request, session, resume.get_all_interests)
 
 
 @app.get(
@@ -404,90 +722,96 @@ async def get_all_interests() -> models.InterestsResponse:
     status_code=status.HTTP_200_OK,
     tags=["Interests"],
 )
-async def get_interests_by_category(
-    category: models.InterestTypes,
+def get_interests_by_category(
+    category: models.InterestTypes, session: Session = Depends(get_session)
 ) -> List[models.Interest]:
     """
     Find all interests for the requested category.
 
     - **category**: Either personal or professional
     """
-    return resume.get_interests_by_category(category)
+    return resume.get_interests_by_category(session, category)
 
 
 @app.get(
     "/social_links",
     summary="Social links",
     response_description="Social links",
-    response_model=List[models.SocialLink],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[models.SocialLink]}},
     status_code=status.HTTP_200_OK,
     tags=["Social"],
 )
-async def get_social_links() -> List[models.SocialLink]:
+def get_social_links(
+    request: Request,
+    session: Session = Depends(get_session),
+) -> Response:
     """Find a list of links to me on the web."""
-    return resume.get_social_links()
+    return cached_json_response(request, session, resume.get_social_links)
 
 
 @app.get(
     "/social_links/{platform}",
     summary="Social link",
     response_description="Social link",
-    responses={status.HTTP_404_NOT_FOUND: {"models": models.SocialLink}},
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": models.SocialLink},
+        status.HTTP_404_NOT_FOUND: {"models": models.SocialLink},
+    },
     status_code=status.HTTP_200_OK,
     tags=["Social"],
 )
-async def get_social_link_by_key(
-    platform=models.SocialLinkEnum,
-) -> models.SocialLink:
+def get_social_link_by_key(
+    request: Request,
+    platform: models.SocialLinkEnum,
+    session: Session = Depends(get_session),
+) -> Response:
     """
     Find the social link specified in the path.
 
     - **platform**: Name of the social media platform whose link to return
     """
-    try:
-        return resume.get_social_link(platform)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No link stored for {platform}",
-        )
+    return cached_json_response(
+        request, session, resume.get_social_link, platform.value
+    )
 
 
 @app.get(
     "/skills",
     summary="Skills",
     response_description="Skills",
-    response_model=List[models.Skill],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[models.Skill]}},
     status_code=status.HTTP_200_OK,
     tags=["Skills"],
 )
-async def get_skills() -> List[models.Skill]:
+def get_skills(request: Request, session: Session = Depends(get_session)) -> Response:
     """Find a (non-comprehensive) list of skills and info about them."""
-    return resume.get_skills()
+    return cached_json_response(request, session, resume.get_skills)
 
 
 @app.get(
     "/skills/{skill}",
     summary="Skill",
     response_description="Skill",
-    response_model=models.Skill,
-    responses={status.HTTP_404_NOT_FOUND: {"model": models.Skill}},
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": models.Skill},
+        status.HTTP_404_NOT_FOUND: {"model": models.Skill},
+    },
     status_code=status.HTTP_200_OK,
     tags=["Skills"],
 )
-async def get_skill(skill: str) -> models.Skill:
+def get_skill(
+    request: Request, skill: str, session: Session = Depends(get_session)
+) -> Response:
     """
     Find the skill specified in the path.
 
     - **skill**: Name of the skill to look up
     """
-    try:
-        return resume.get_skill(skill)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"The requested skill {skill} does not exist (yet!)",
-        )
+    return cached_json_response(request, session, resume.get_skill, skill)
 
 
 @app.get(
@@ -495,28 +819,30 @@ async def get_skill(skill: str) -> models.Skill:
     summary="Competencies",
     description="",
     response_description="Competencies",
-    response_model=List[models.Competency],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[models.Competency]}},
     status_code=status.HTTP_200_OK,
     tags=["Skills"],
 )
-async def get_competencies() -> List[models.Competency]:
+def get_competencies(
+    request: Request,
+    session: Session = Depends(get_session),
+) -> Response:
     """Find a list of general technical and non-technical skills."""
-    return resume.get_competencies()
+    return cached_json_response(request, session, resume.get_competencies)
 
 
 # PUT methods for create and update operations
-@app.put(
+@auth_router.put(
     "/basic_info",
     summary="Create or update an existing fact",
     response_description="The body of the new or updated fact",
     status_code=status.HTTP_201_CREATED,
     tags=["Basic Info"],
 )
-async def add_or_update_fact(
+def add_or_update_fact(
     basic_fact: models.BasicInfo = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.BasicInfo:
     """
     Create or update an existing fact.
@@ -524,10 +850,10 @@ async def add_or_update_fact(
     - **fact**: The name of the fact
     - **value**: The value of the fact
     """
-    return resume.upsert_basic_info_item(basic_fact)
+    return resume.upsert_basic_info_item(session, basic_fact)
 
 
-@app.put(
+@auth_router.put(
     "/education",
     summary="Create or update an education item",
     description="",
@@ -535,11 +861,9 @@ async def add_or_update_fact(
     status_code=status.HTTP_201_CREATED,
     tags=["Education"],
 )
-async def add_or_update_education(
+def add_or_update_education(
     education_item: models.Education = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.Education:
     """
     Create or update an education item.
@@ -550,21 +874,19 @@ async def add_or_update_education(
     - **graduation_date**: The year graduated from the institution
     - **gpa**: The grade point average on completion of the degree
     """
-    return resume.upsert_education_item(education_item)
+    return resume.upsert_education_item(session, education_item)
 
 
-@app.put(
+@auth_router.put(
     "/experience",
     summary="Create or update an experience item",
     response_description="ID of the new or updated experience item",
     status_code=status.HTTP_201_CREATED,
     tags=["Experience"],
 )
-async def add_or_update_experience(
+def add_or_update_experience(
     experience_item: models.Job = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.Job:
     """
     Create or update an experience item.
@@ -576,10 +898,10 @@ async def add_or_update_experience(
     - **job_title**: The job title held
     - **job_summary**: A brief description of the job
     """
-    return resume.upsert_experience_item(experience_item)
+    return resume.upsert_experience_item(session, experience_item)
 
 
-@app.put(
+@auth_router.put(
     "/experience/detail",
     summary="Create or update a job detail",
     response_description="New or udpated job detail",
@@ -587,11 +909,9 @@ async def add_or_update_experience(
     status_code=status.HTTP_201_CREATED,
     tags=["Experience"],
 )
-async def add_or_update_experience_detail(
+def add_or_update_experience_detail(
     experience_detail_item: models.JobDetail = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.JobDetail:
     """
     Create or update a job detail.
@@ -600,10 +920,10 @@ async def add_or_update_experience_detail(
     - **detail**: A detail to include for the job specified by ID
     - **job_id**: The internal ID of the job associated with this detail
     """
-    return resume.upsert_job_detail(experience_detail_item)
+    return resume.upsert_job_detail(session, experience_detail_item)
 
 
-@app.put(
+@auth_router.put(
     "/experience/highlight",
     summary="Create or update a job highlight",
     response_description="New or updated job highlight",
@@ -611,11 +931,9 @@ async def add_or_update_experience_detail(
     status_code=status.HTTP_201_CREATED,
     tags=["Experience"],
 )
-async def add_or_update_experience_highlight(
+def add_or_update_experience_highlight(
     experience_highlight_item: models.JobHighlight = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.JobHighlight:
     """
     Create or update a job highlight.
@@ -624,10 +942,10 @@ async def add_or_update_experience_highlight(
     - **highlight**: A highlight to include for the job specified by ID
     - **job_id**: The internal ID of the job associated with this highlight
     """
-    return resume.upsert_job_highlight(experience_highlight_item)
+    return resume.upsert_job_highlight(session, experience_highlight_item)
 
 
-@app.put(
+@auth_router.put(
     "/certifications",
     summary="Create or update a certification",
     response_description="ID of the new or updated certification",
@@ -635,11 +953,9 @@ async def add_or_update_experience_highlight(
     status_code=status.HTTP_201_CREATED,
     tags=["Certifications"],
 )
-async def add_or_update_certification(
+def add_or_update_certification(
     certification: models.Certification = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.Certification:
     """
     Create or update a certification.
@@ -650,10 +966,10 @@ async def add_or_update_certification(
     - **valid**: Whether the certification is currently valid (unexpired)
     - **progress**: How much progress has been made toward attaining the certification
     """
-    return resume.upsert_certification(certification)
+    return resume.upsert_certification(session, certification)
 
 
-@app.put(
+@auth_router.put(
     "/side_projects",
     summary="Create or update a side project",
     response_description="ID of the new or updated side project",
@@ -661,11 +977,9 @@ async def add_or_update_certification(
     status_code=status.HTTP_201_CREATED,
     tags=["Side Projects"],
 )
-async def add_or_update_side_project(
+def add_or_update_side_project(
     side_project: models.SideProject = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.SideProject:
     """
     Create or update a side project.
@@ -674,10 +988,10 @@ async def add_or_update_side_project(
     - **tagline**: A one-sentance description of the project
     - **link**: A URL link to the project to get more details
     """
-    return resume.upsert_side_project(side_project)
+    return resume.upsert_side_project(session, side_project)
 
 
-@app.put(
+@auth_router.put(
     "/interests/{category}",
     summary="Create or update an interest",
     response_description="ID of the new or updated interest",
@@ -685,12 +999,10 @@ async def add_or_update_side_project(
     status_code=status.HTTP_201_CREATED,
     tags=["Interests"],
 )
-async def add_or_update_interest(
+def add_or_update_interest(
     category: models.InterestTypes,
     interest: models.Interest = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.Interest:
     """
     Create or update an interest.
@@ -698,10 +1010,10 @@ async def add_or_update_interest(
     - **category**: personal or professional
     - **interest**: Interest to add to the list
     """
-    return resume.upsert_interest(category, interest.interest)
+    return resume.upsert_interest(session, category, interest.interest)
 
 
-@app.put(
+@auth_router.put(
     "/social_links",
     summary="Create or update a social link",
     response_description="The new or udpated social link",
@@ -709,11 +1021,9 @@ async def add_or_update_interest(
     status_code=status.HTTP_201_CREATED,
     tags=["Social"],
 )
-async def add_or_create_social_link(
+def add_or_create_social_link(
     social_link: models.SocialLink,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.SocialLink:
     """
     Create or update a social link.
@@ -721,21 +1031,29 @@ async def add_or_create_social_link(
     - **platform**: The social platform to configure
     - **link**: A URL to the social profile associated with the platform
     """
-    return resume.upsert_social_link(social_link)
+    # Table models skip validation, so the platform is checked here; it is stored
+    # as the SocialLinkEnum value that GET /social_links/{platform} accepts.
+    try:
+        platform = models.SocialLinkEnum(str(social_link.platform).lower())
+    except ValueError:
+        raise HTTPException(  # pylint: disable=raise-missing-from
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unsupported platform {social_link.platform}",
+        )
+    social_link.platform = platform.value
+    return resume.upsert_social_link(session, social_link)
 
 
-@app.put(
+@auth_router.put(
     "/skills",
     summary="Create or update a skill",
     response_description="The new or updated skill",
     status_code=status.HTTP_201_CREATED,
     tags=["Skills"],
 )
-async def add_or_update_skill(
+def add_or_update_skill(
     skill: models.Skill = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.Skill:
     """
     Create or update a skill.
@@ -743,43 +1061,39 @@ async def add_or_update_skill(
     - **skill**: The name of the skill to configure
     - **level**: Skill level out of 100
     """
-    return resume.upsert_skill(skill)
+    return resume.upsert_skill(session, skill)
 
 
-@app.put(
+@auth_router.put(
     "/competencies/{competency}",
     summary="Create or update a competency",
     response_description="New or updated competency",
     status_code=status.HTTP_201_CREATED,
     tags=["Skills"],
 )
-async def add_or_update_competency(
+def add_or_update_competency(
     # competency: models.Competencies = Body(...),
     competency: str,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.Competency:
     """
     Create or update a competency.
 
     - **competency**: The competency to add to the list
     """
-    return resume.upsert_competency(competency)
+    return resume.upsert_competency(session, competency)
 
 
-@app.put(
+@auth_router.put(
     "/preferences",
     summary="Create or udpate a preference,",
     response_description="New or updated preference",
     status_code=status.HTTP_201_CREATED,
     tags=["Preferences"],
 )
-async def add_or_update_preference(
+def add_or_update_preference(
     preference: models.Preference = Body(...),
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ) -> models.Preference:
     """
     Create or update a preference.
@@ -787,331 +1101,241 @@ async def add_or_update_preference(
     - **preference**: The type of preference
     - **value**: The value of the preference
     """
-    return resume.upsert_preference(preference)
+    return resume.upsert_preference(session, preference)
 
 
 # DELETE methods for delete operations
-@app.delete(
+@auth_router.delete(
     "/basic_info/{fact}",
     summary="Delete an existing fact",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Basic Info"],
 )
-async def delete_fact(
+def delete_fact(
     fact: str,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing fact.
 
     - **fact**: The key of the fact to remove (e.g. name)
     """
-    try:
-        resume.delete_basic_info_item(fact)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No such fact '{fact}'",
-        )
+    resume.delete_basic_info_item(session, fact)
 
 
-@app.delete(
+@auth_router.delete(
     "/education/{index}",
     summary="Delete an existing education history item",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Education"],
 )
-async def delete_education_item(
+def delete_education_item(
     index: int,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing education history item.
 
     - **id**: The internal ID of the education history item to delete
     """
-    try:
-        resume.delete_education_item(index)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such eduction item exists",
-        )
+    resume.delete_education_item(session, index)
 
 
-@app.delete(
+@auth_router.delete(
     "/experience/{index}",
     summary="Delete an existing job history item",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Experience"],
 )
-async def delete_experience_item(
+def delete_experience_item(
     index: int,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing job history item.
 
     - **index**: The internal ID of the job to delete
     """
-    try:
-        resume.delete_experience_item(index)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such job history item exists",
-        )
+    resume.delete_experience_item(session, index)
 
 
-@app.delete(
+@auth_router.delete(
     "/experience/detail/{index}",
     summary="Delete a job detail",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Experience"],
 )
-async def delete_experience_detail_item(
+def delete_experience_detail_item(
     index: int,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete a job detail.
 
     - **index**: The internal ID of the job detail to delete
     """
-    try:
-        resume.delete_job_detail(index)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such job detail item exists",
-        )
+    resume.delete_job_detail(session, index)
 
 
-@app.delete(
+@auth_router.delete(
     "/experience/highlight/{index}",
     summary="Delete a job highlight",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Experience"],
 )
-async def delete_experience_highlight_item(
+def delete_experience_highlight_item(
     index: int,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete a job highlight.
 
     - **index**: The internal ID of the job highlight to delete
     """
-    try:
-        resume.delete_job_highlight(index)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such job highlight item exists",
-        )
+    resume.delete_job_highlight(session, index)
 
 
-@app.delete(
+@auth_router.delete(
     "/certifications/{certification}",
     summary="Delete an existing certification",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Certifications"],
 )
-async def delete_certification(
+def delete_certification(
     certification: str,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing certification.
 
     - **certification**: The case-sensitive, well-known name of the certification
     """
-    try:
-        resume.delete_certification(certification)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such certification exists",
-        )
+    resume.delete_certification(session, certification)
 
 
-@app.delete(
+@auth_router.delete(
     "/side_projects/{project}",
     summary="Delete an existing side project",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Side Projects"],
 )
-async def delete_side_project(
+def delete_side_project(
     project: str,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing side project.
 
     - **project**: The name of the project to delete
     """
-    try:
-        resume.delete_side_project(project)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such side project exists",
-        )
+    resume.delete_side_project(session, project)
 
 
-@app.delete(
+@auth_router.delete(
     "/interests/{interest}",
     summary="Delete an existing interest",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Interests"],
 )
-async def delete_interest(
+def delete_interest(
     interest: str,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing interest.
 
     - **interest**: The interest to remove from the list
     """
-    try:
-        resume.delete_interest(interest)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such interest exists",
-        )
+    resume.delete_interest(session, interest)
 
 
-@app.delete(
+@auth_router.delete(
     "/social_links/{platform}",
     summary="Delete an existing social link",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Social"],
 )
-async def delete_social_link(
-    platform: str,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+def delete_social_link(
+    platform: models.SocialLinkEnum,
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing social link by platform.
 
     - **platform**: The name of the platform whose link to delete
     """
-    try:
-        resume.delete_social_link(platform)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such social link exists",
-        )
+    resume.delete_social_link(session, platform.value)
 
 
-@app.delete(
+@auth_router.delete(
     "/skills/{skill}",
     summary="Delete an existing skill",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Skills"],
 )
-async def delete_skill(
+def delete_skill(
     skill: str,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing skill.
 
     - **skill**: The skill to delete
     """
-    try:
-        resume.delete_skill(skill)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such skill exists",
-        )
+    resume.delete_skill(session, skill)
 
 
-@app.delete(
+@auth_router.delete(
     "/competencies/{competency}",
     summary="Delete an existing competency",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Skills"],
 )
-async def delete_competency(
+def delete_competency(
     competency: str,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing competency.
 
     - **competency**: The competency to delete
     """
-    try:
-        resume.delete_competency(competency)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such competency exists",
-        )
+    resume.delete_competency(session, competency)
 
 
-@app.delete(
+@auth_router.delete(
     "/preferences/{preference}",
     summary="Delete a prefeerence",
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["Preferences"],
 )
-async def delete_preference(
+def delete_preference(
     preference: str,
-    current_user: models.User = Depends(  # pylint: disable=unused-argument
-        get_current_active_user
-    ),
+    session: Session = Depends(get_session),
 ):
     """
     Delete an existing preference.
 
     - **preference**: The preference to delete.
     """
-    try:
-        resume.delete_preference(preference)
-    except KeyError:
-        raise HTTPException(  # pylint: disable=raise-missing-from
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No such preference exists",
-        )
+    resume.delete_preference(session, preference)
 
 
-if __name__ == "__main__":
-    host = os.getenv("API_HOST", "127.0.0.1")
-    port = os.getenv("API_PORT", "8000")
-    log_level = os.getenv("API_LOG_LEVEL", "error")
-    reload_on_change = os.getenv("API_RELOAD_ON_CHANGE", default="False").title()
-    uvicorn.run(
-        "main:app",
-        host=host,
-        port=int(port),
-        log_level=log_level,
-        reload=(reload_on_change == "True"),
-    )
+@auth_router.post(
+    "/admin/cache/clear",
+    summary="Clear cached resume data",
+    status_code=status.HTTP_204_NO_CONTENT,
+    tags=["Admin"],
+)
+def clear_caches(
+    session: Session = Depends(get_session),
+):
+    """
+    Drop every cached resume section so that the next reads come from the database.
+
+    Only needed after the database has been changed outside of the API.
+    """
+    resume.clear_caches(session)
+
+
+app.include_router(auth_router)
@@ -9,10 +9,22 @@ from pathlib import Path
 from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, EmailStr
-from sqlmodel import Field, SQLModel, UniqueConstraint, create_engine
+from sqlmodel import (
+    Field,
+    Index,
+    Relationship,
+    Session,
+    SQLModel,
+    UniqueConstraint,
+    create_engine,
+)
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
 
 logger = logging.getLogger(__name__)
+RESUME_CACHE_ID = 1
 
 
 class User(SQLModel, table=True):  # noqa: D101
@@ -107,6 +119,14 @@ class BasicInfos(BaseModel):  # noqa: D101
 class Education(SQLModel, table=True):  # noqa: D101
     """Education table and object model."""
 
+    __table_args__ = (
+        Index(
+            "ix_education_institution_degree_graduation_date",
+            "institution",
+            "degree",
+            "graduation_date",
+        ),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     institution: str
     degree: str
@@ -137,6 +157,8 @@ class Job(SQLModel, table=True):  # noqa: D101
     job_title: str
     job_summary: str
     time: str
+    details: List["JobDetail"] = Relationship(back_populates="job")
+    highlights: List["JobHighlight"] = Relationship(back_populates="job")
 
     class Config:  # noqa: D106
         """Job configuration."""
@@ -194,7 +216,8 @@ class JobHighlight(SQLModel, table=True):  # noqa: D101
 
     id: Optional[int] = Field(default=None, primary_key=True)
     highlight: str
-    job_id: Optional[int] = Field(default=None, foreign_key="job.id")
+    job_id: Optional[int] = Field(default=None, foreign_key="job.id", index=True)
+    job: Optional[Job] = Relationship(back_populates="highlights")
 
 
 class JobDetail(SQLModel, table=True):  # noqa: D101
@@ -202,13 +225,22 @@ class JobDetail(SQLModel, table=True):  # noqa: D101
 
     id: Optional[int] = Field(default=None, primary_key=True)
     detail: str
-    job_id: Optional[int] = Field(default=None, foreign_key="job.id")
+    job_id: Optional[int] = Field(default=None, foreign_key="job.id", index=True)
+    job: Optional[Job] = Relationship(back_populates="details")
 
 
 class Certification(SQLModel, table=True):  # noqa: D101
     """Certification table and object model."""
 
-    __table_args__ = (UniqueConstraint("cert"),)
+    __table_args__ = (
+        UniqueConstraint("cert"),
+        Index(
+            "ix_certification_valid",
+            "id",
+            postgresql_where=text("valid"),
+            sqlite_where=text("valid"),
+        ),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     cert: str = Field()
     full_name: str
@@ -258,7 +290,9 @@ class Interest(SQLModel, table=True):  # noqa: D101
 
     __table_args__ = (UniqueConstraint("interest"),)
     id: Optional[int] = Field(default=None, primary_key=True)
-    interest_type_id: Optional[int] = Field(default=None, foreign_key="interesttype.id")
+    interest_type_id: Optional[int] = Field(
+        default=None, foreign_key="interesttype.id", index=True
+    )
     interest: str = Field()
 
 
@@ -388,7 +422,7 @@ class FullResume(BaseModel):  # noqa: D101
     certifications: List[Certification]
     competencies: List[str]
     education: List[Education]
-    experience: List[Job]
+    experience: List[JobResponse]
     interests: Dict[InterestTypes, List[str]]
     preferences: Preferences
     side_projects: List[SideProject]
@@ -396,6 +430,14 @@ class FullResume(BaseModel):  # noqa: D101
     social_links: List[SocialLink]
 
 
+class ResumeCache(SQLModel, table=True):  # noqa: D101
+    """Serialized full resume table, cleared whenever any section changes."""
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    payload: Optional[str] = Field(default=None)
+    version: int = Field(default=0)
+
+
 def configure_engine(engine_echo: bool = False) -> Engine:
     """
     Generate the SQLAlchemy engine for use by the API.
@@ -418,13 +460,23 @@ def configure_engine(engine_echo: bool = False) -> Engine:
             "SQLITE_DB_PATH", default=f"{default_path}/{db_name}.db"
         )
         logger.debug("attempting to use sqlite database stored at %s", sqlite_file)
-        sql_engine = create_engine(f"sqlite:///{sqlite_file}", echo=engine_echo)
+        sql_engine = create_engine(
+            f"sqlite:///{sqlite_file}",
+            echo=engine_echo,
+            pool_pre_ping=True,
+            query_cache_size=1200,
+        )
     elif db_type.lower() == "postgresql":
         logger.debug("postgresql configuration db type detected")
         db_port = os.getenv("DB_PORT", default="5432")
         sql_engine = create_engine(
             f"postgresql://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}",
             echo=engine_echo,
+            pool_pre_ping=True,
+            pool_size=int(os.getenv("DB_POOL_SIZE", default="25")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", default="25")),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", default="1800")),
+            query_cache_size=1200,
         )
     else:
         raise ValueError(
@@ -434,7 +486,30 @@ def configure_engine(engine_echo: bool = False) -> Engine:
     logger.debug("creating all tables that do not exist")
     SQLModel.metadata.create_all(sql_engine)
     logger.debug("finished creating tables")
+    init_resume_cache(sql_engine)
     return sql_engine
 
 
+def init_resume_cache(sql_engine: Engine) -> None:
+    """
+    Create the row holding the serialized full resume if it does not exist yet.
+
+    Every write bumps the version stored in this row, so it has to exist before the
+    API serves any request.
+
+    :param sql_engine: The engine whose database should hold the row
+    :type sql_engine: sqlalchemy.engine.Engine
+    """
+    with Session(sql_engine) as session:
+        if session.get(ResumeCache, RESUME_CACHE_ID) is not None:
+            return
+        session.add(ResumeCache(id=RESUME_CACHE_ID))
+        try:
+            session.commit()
+        except IntegrityError:
+            # Another worker created the row first
+            session.rollback()
+
+
 engine = configure_engine()
+SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
@@ -1 +1,20 @@
 #!/usr/bin/env python3
+"""Configure the API for the test suite."""
+
+import os
+import shutil
+import tempfile
+
+# The API reads its settings when its modules are imported, so they have to be in
+# place before any test module imports them.
+TEST_DIR = tempfile.mkdtemp(prefix="resumeapi-tests-")
+os.environ["DB_TYPE"] = "sqlite"
+os.environ["SQLITE_DB_PATH"] = os.path.join(TEST_DIR, "resume.db")
+os.environ["SECRET_KEY"] = "test-secret-key"
+os.environ["ALGORITHM"] = "HS256"
+os.environ["BCRYPT_ROUNDS"] = "4"
+
+
+def pytest_unconfigure(config):  # pylint: disable=unused-argument
+    """Remove the temporary database once the test session is over."""
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Test the controller classes."""
+
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from resumeapi import controller  # pylint: disable=import-error
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """Stand in for the time module, at a time set by the test."""
+
+    def __init__(self, now: float) -> None:
+        """Start the clock at the given time."""
+        self.now = now
+
+    def time(self) -> float:
+        """Tell the time."""
+        return self.now
+
+
+def test_login_lockout_ends_with_its_window(monkeypatch):
+    """Test that failing while locked out does not extend the lockout."""
+    clock = FakeClock(1_000_000.0 * controller.LOGIN_FAILURE_WINDOW_SECONDS)
+    monkeypatch.setattr(controller, "time", clock)
+    monkeypatch.setattr(controller, "MAX_LOGIN_FAILURES", 2)
+    auth = controller.AuthController()
+    clock.now += controller.LOGIN_FAILURE_WINDOW_SECONDS - 10
+    for _ in range(2):
+        assert auth.login_retry_after("192.0.2.1", "admin@example.com") == 0
+        auth.record_login_failure("192.0.2.1", "Admin@example.com")
+    assert auth.login_retry_after("192.0.2.1", "admin@example.com") == 10
+    assert auth.login_retry_after("192.0.2.2", "admin@example.com") == 0
+    clock.now += 9
+    auth.record_login_failure("192.0.2.1", "admin@example.com")
+    assert auth.login_retry_after("192.0.2.1", "admin@example.com") == 1
+    clock.now += 1
+    assert auth.login_retry_after("192.0.2.1", "admin@example.com") == 0
+
+
+def test_access_token_matches_pyjwt():
+    """Test that hand-signed HS256 tokens are the ones PyJWT would produce."""
+    auth = controller.AuthController()
+    before = int(datetime.now(timezone.utc).timestamp())
+    token = auth.create_access_token(
+        {"sub": "admin@example.com"}, expires_delta=timedelta(minutes=5)
+    )
+    claims = jwt.decode(token, auth.secret_key, algorithms=["HS256"])
+    assert claims["sub"] == "admin@example.com"
+    assert before + 300 <= claims["exp"] <= before + 301
+    assert token == jwt.encode(claims, auth.secret_key, algorithm="HS256")
+    assert auth.decode_access_token(token) == claims
+
+
+def test_token_settings_are_read_only():
+    """Test that tokens cannot be signed and verified with different settings."""
+    auth = controller.AuthController()
+    with pytest.raises(AttributeError):
+        auth.secret_key = "another-secret-key"
+    with pytest.raises(AttributeError):
+        auth.algorithm = "HS512"
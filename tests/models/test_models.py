@@ -250,3 +250,14 @@ def test_fullresume_class_properties():
     assert all(
         prop in props for prop in models.FullResume.schema()["properties"].keys()
     )
+
+
+def test_resumecache_class_properties():
+    """Test that all the expected fields exist in the ResumeCache table."""
+    props = ["id", "payload", "version"]
+    assert all(
+        prop in models.ResumeCache.schema()["properties"].keys() for prop in props
+    )
+    assert all(
+        prop in props for prop in models.ResumeCache.schema()["properties"].keys()
+    )
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Fixtures for testing the API routes against a temporary SQLite database."""
+
+from fastapi.testclient import TestClient
+import pytest
+from sqlmodel import SQLModel
+
+from resumeapi import controller, main, models  # pylint: disable=import-error
+
+USERNAME = "admin@example.com"
+PASSWORD = "correct horse battery staple"
+
+
+@pytest.fixture(name="client")
+def fixture_client(monkeypatch):
+    """Serve the API from an empty database, with nothing cached in memory."""
+    SQLModel.metadata.drop_all(models.engine)
+    SQLModel.metadata.create_all(models.engine)
+    models.init_resume_cache(models.engine)
+    with models.SessionLocal() as session:
+        session.add(models.InterestType(interest_type="personal"))
+        session.add(models.InterestType(interest_type="technical"))
+        session.commit()
+        main.resume.clear_caches(session)
+    monkeypatch.setattr(main, "auth_control", controller.AuthController())
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(name="auth_headers")
+def fixture_auth_headers(client):
+    """Create a user and log in as them."""
+    main.auth_control.create_user(USERNAME, PASSWORD)
+    response = client.post("/token", data={"username": USERNAME, "password": PASSWORD})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture(name="full_resume")
+def fixture_full_resume(client, auth_headers):
+    """Store every fact and preference needed to build the full resume."""
+    facts = {
+        "name": "Jane Doe",
+        "pronouns": "['they', 'them']",
+        "email": "jane@example.com",
+        "phone": "555-0100",
+        "about": "Network engineer",
+    }
+    for fact, value in facts.items():
+        client.put(
+            "/basic_info", json={"fact": fact, "value": value}, headers=auth_headers
+        )
+    preferences = {
+        "OS": "['Linux']",
+        "EDITOR": "vim",
+        "TERMINAL": "kitty",
+        "LANGUAGES": "['Python']",
+        "TEST_SUITES": "['pytest']",
+    }
+    for preference, value in preferences.items():
+        client.put(
+            "/preferences",
+            json={"preference": preference, "value": value},
+            headers=auth_headers,
+        )
+    client.put("/skills", json={"skill": "Git", "level": 75}, headers=auth_headers)
+
+
+@pytest.fixture(name="resume_pdf")
+def fixture_resume_pdf(client, monkeypatch, tmp_path):
+    """Serve a stand-in resume PDF, large enough to be worth compressing."""
+    # pylint: disable=unused-argument
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(b"%PDF-1.4 " + b"resume " * 200)
+    monkeypatch.setattr(main, "RESUME_PDF", str(pdf))
+    monkeypatch.setattr(main.app.state, "pdf_stat", None)
+    monkeypatch.setattr(main.app.state, "pdf_etag", None)
+    main.load_resume_pdf()
+    return pdf.read_bytes()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""Test the API routes."""
+
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+import jwt
+import pytest
+from sqlalchemy import update
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from resumeapi import controller, main, models  # pylint: disable=import-error
+from tests.routes.conftest import PASSWORD, USERNAME  # pylint: disable=import-error
+
+
+def _set_skill_level(level: int, bump_version: bool = False) -> None:
+    """Change a skill behind the API's back, as another process would."""
+    with models.SessionLocal() as session:
+        session.execute(
+            update(models.Skill).where(models.Skill.skill == "Git").values(level=level)
+        )
+        if bump_version:
+            session.execute(
+                update(models.ResumeCache).values(
+                    payload=None, version=models.ResumeCache.version + 1
+                )
+            )
+        session.commit()
+
+
+def test_section_reads_are_cached(client, auth_headers):
+    """Test that repeated reads are served from memory rather than the database."""
+    client.put("/skills", json={"skill": "Git", "level": 75}, headers=auth_headers)
+    assert client.get("/skills/Git").json()["level"] == 75
+    assert client.get("/skills").json()[0]["level"] == 75
+    _set_skill_level(90)
+    assert client.get("/skills/Git").json()["level"] == 75
+    assert client.get("/skills").json()[0]["level"] == 75
+
+
+def test_writes_invalidate_cached_reads(client, auth_headers):
+    """Test that a write through the API replaces every cached read."""
+    client.put("/skills", json={"skill": "Git", "level": 75}, headers=auth_headers)
+    assert client.get("/skills/Git").json()["level"] == 75
+    assert client.get("/skills").json()[0]["level"] == 75
+    client.put("/skills", json={"skill": "Git", "level": 80}, headers=auth_headers)
+    assert client.get("/skills/Git").json()["level"] == 80
+    assert client.get("/skills").json()[0]["level"] == 80
+
+
+def test_writes_from_other_processes_invalidate_cached_reads(client, auth_headers):
+    """Test that cached reads follow the resume version stored in the database."""
+    client.put("/skills", json={"skill": "Git", "level": 75}, headers=auth_headers)
+    assert client.get("/skills/Git").json()["level"] == 75
+    _set_skill_level(90, bump_version=True)
+    assert client.get("/skills/Git").json()["level"] == 90
+
+
+def test_clear_caches(client, auth_headers):
+    """Test that clearing the caches picks up changes made outside of the API."""
+    client.put("/skills", json={"skill": "Git", "level": 75}, headers=auth_headers)
+    assert client.get("/skills/Git").json()["level"] == 75
+    _set_skill_level(90)
+    assert client.post("/admin/cache/clear").status_code == 401
+    assert client.post("/admin/cache/clear", headers=auth_headers).status_code == 204
+    assert client.get("/skills/Git").json()["level"] == 90
+
+
+def test_section_etag(client, auth_headers):
+    """Test that section reads carry an ETag and answer conditional requests."""
+    client.put("/skills", json={"skill": "Git", "level": 75}, headers=auth_headers)
+    response = client.get("/skills")
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == main.RESPONSE_CACHE_CONTROL
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get("/skills", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+    client.put("/skills", json={"skill": "Git", "level": 80}, headers=auth_headers)
+    response = client.get("/skills", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_full_resume_is_stored_until_written(client, auth_headers, full_resume):
+    """Test that the serialized resume is stored and cleared by the next write."""
+    # pylint: disable=unused-argument
+    response = client.get("/")
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+    assert response.json()["basic_info"]["name"] == "Jane Doe"
+    with models.SessionLocal() as session:
+        cache = session.get(models.ResumeCache, models.RESUME_CACHE_ID)
+        assert cache.payload == response.text
+        version = cache.version
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+    client.put("/skills", json={"skill": "Git", "level": 80}, headers=auth_headers)
+    with models.SessionLocal() as session:
+        cache = session.get(models.ResumeCache, models.RESUME_CACHE_ID)
+        assert cache.payload is None
+        assert cache.version > version
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["skills"][0]["level"] == 80
+
+
+def test_missing_pdf_returns_404(client):
+    """Test that the PDF route answers with a 404 when there is no PDF."""
+    response = client.get("/pdf")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "No file at this location"}
+
+
+def test_pdf_etag(client, resume_pdf):
+    """Test that the PDF carries an ETag and answers conditional requests."""
+    response = client.get("/pdf")
+    assert response.status_code == 200
+    assert response.content == resume_pdf
+    assert response.headers["cache-control"] == main.PDF_CACHE_CONTROL
+    response = client.get("/pdf", headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_pdf_encoding_follows_each_request(client, resume_pdf):
+    """Test that one client's Accept-Encoding does not leak into the next response."""
+    for encoding in ("gzip", "identity"):
+        response = client.get("/pdf", headers={"Accept-Encoding": encoding})
+        assert response.status_code == 200
+        assert response.content == resume_pdf
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(resume_pdf))
+
+
+def test_pdf_is_not_recompressed(client, resume_pdf):
+    """Test that the already-compressed PDF is sent as-is with its strong ETag."""
+    response = client.get("/pdf", headers={"Accept-Encoding": "gzip"})
+    assert response.content == resume_pdf
+    assert "content-encoding" not in response.headers
+    assert not response.headers["etag"].startswith("W/")
+
+
+def test_compressed_responses_carry_weak_etags(client, auth_headers):
+    """Test that gzip bodies do not reuse the identity body's strong ETag."""
+    for index in range(40):
+        client.put(
+            "/skills",
+            json={"skill": f"Skill {index}", "level": 50},
+            headers=auth_headers,
+        )
+    identity = client.get("/skills", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    etag = identity.headers["etag"]
+    response = client.get("/skills", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == f"W/{etag}"
+    assert response.content == identity.content
+    response = client.get(
+        "/skills",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": f"W/{etag}"},
+    )
+    assert response.status_code == 304
+
+
+def test_html_redirect(client):
+    """Test that the HTML route redirects to the rendered resume."""
+    response = client.get("/html", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == main.HTML_REDIRECT.headers["location"]
+    response = client.get(
+        "/html", headers={"Accept-Encoding": "gzip"}, follow_redirects=False
+    )
+    assert "content-encoding" not in response.headers
+
+
+def test_missing_items_return_404(client):
+    """Test that lookups of missing items answer with a 404 and a message."""
+    expected = {
+        "/skills/Git": "The requested skill Git does not exist (yet!)",
+        "/education/1": "No education item 1",
+        "/experience/1": "No experience item 1",
+        "/basic_info/name": "No basic info item name",
+    }
+    for path, detail in expected.items():
+        response = client.get(path)
+        assert response.status_code == 404
+        assert response.json() == {"detail": detail}
+
+
+def test_unexpected_lookup_errors_are_not_404(client, monkeypatch):
+    """Test that a KeyError from a bug is not passed off as a missing item."""
+
+    def broken_render_json(content):
+        raise KeyError("internal")
+
+    monkeypatch.setattr(main, "render_json", broken_render_json)
+    with pytest.raises(KeyError):
+        client.get("/skills")
+
+
+def test_upserts_update_existing_rows(client, auth_headers):
+    """Test that writing an existing item updates it in place."""
+    first = client.put(
+        "/skills", json={"skill": "Git", "level": 75}, headers=auth_headers
+    ).json()
+    second = client.put(
+        "/skills", json={"skill": "Git", "level": 80}, headers=auth_headers
+    ).json()
+    assert first["id"] == second["id"]
+    assert client.get("/skills").json() == [
+        {"id": first["id"], "skill": "Git", "level": 80}
+    ]
+    for _ in range(2):
+        response = client.put("/competencies/Routing", headers=auth_headers)
+        assert response.status_code == 201
+    assert client.get("/competencies").json() == [{"id": 1, "competency": "Routing"}]
+    for value in ("John", "Jane"):
+        client.put(
+            "/basic_info", json={"fact": "name", "value": value}, headers=auth_headers
+        )
+    assert client.get("/basic_info/name").json()["value"] == "Jane"
+
+
+def test_writes_require_authentication(client):
+    """Test that writes are refused without a valid token."""
+    response = client.put("/skills", json={"skill": "Git", "level": 75})
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_token_user_is_cached(client, auth_headers):
+    """Test that the user behind a token is cached once the token is verified."""
+    token = auth_headers["Authorization"].removeprefix("Bearer ")
+    assert main.auth_control.get_cached_token_user(token) is None
+    response = client.get("/users/me", headers=auth_headers)
+    assert response.json() == {"username": USERNAME, "disabled": False}
+    assert main.auth_control.get_cached_token_user(token).username == USERNAME
+
+
+def test_repeat_logins_skip_bcrypt(client, monkeypatch):
+    """Test that repeated logins, good or bad, reuse the earlier verification."""
+    main.auth_control.create_user(USERNAME, PASSWORD)
+    checks = []
+    verify_password = main.auth_control.verify_password
+
+    def counting_verify_password(plain_password, hashed_password):
+        checks.append(plain_password)
+        return verify_password(plain_password, hashed_password)
+
+    monkeypatch.setattr(main.auth_control, "verify_password", counting_verify_password)
+    for _ in range(2):
+        response = client.post(
+            "/token", data={"username": USERNAME, "password": PASSWORD}
+        )
+        assert response.status_code == 201
+    for _ in range(2):
+        response = client.post(
+            "/token", data={"username": USERNAME, "password": "wrong"}
+        )
+        assert response.status_code == 401
+    assert checks == [PASSWORD, "wrong"]
+
+
+def test_invalid_tokens_are_rejected(client, auth_headers):
+    """Test that malformed, forged and expired tokens are all refused."""
+    # pylint: disable=unused-argument
+    forged = jwt.encode({"sub": USERNAME}, "not-the-secret-key", algorithm="HS256")
+    expired = main.auth_control.create_access_token(
+        {"sub": USERNAME}, expires_delta=timedelta(seconds=-1)
+    )
+    for token in ("garbage", "a" * 5000 + ".b.c", forged, expired):
+        response = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401
+    assert main.auth_control.is_rejected_token(forged)
+    assert main.auth_control.is_rejected_token(expired)
+    assert client.get("/users/me", headers=auth_headers).status_code == 200
+
+
+def test_deactivated_user_is_refused(client, auth_headers):
+    """Test that deactivating a user invalidates their cached authentication."""
+    assert client.get("/users/me", headers=auth_headers).status_code == 200
+    main.auth_control.deactivate_user(USERNAME)
+    response = client.get("/users/me", headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Inactive user"}
+    response = client.post("/token", data={"username": USERNAME, "password": PASSWORD})
+    assert response.status_code == 401
+
+
+def test_failed_logins_are_throttled(client, monkeypatch):
+    """Test that a client is locked out of a user after too many failed logins."""
+    main.auth_control.create_user(USERNAME, PASSWORD)
+    monkeypatch.setattr(controller, "MAX_LOGIN_FAILURES", 2)
+    # The client's address comes from X-Forwarded-For, as it does behind a proxy
+    proxied = TestClient(ProxyHeadersMiddleware(main.app, trusted_hosts="testclient"))
+
+    def login(client_ip, username, password):
+        return proxied.post(
+            "/token",
+            data={"username": username, "password": password},
+            headers={"X-Forwarded-For": client_ip},
+        )
+
+    for _ in range(2):
+        assert login("192.0.2.1", USERNAME, "wrong").status_code == 401
+    response = login("192.0.2.1", USERNAME, PASSWORD)
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Too many failed login attempts."}
+    assert (
+        0
+        < int(response.headers["retry-after"])
+        <= controller.LOGIN_FAILURE_WINDOW_SECONDS
+    )
+    assert login("192.0.2.2", USERNAME, PASSWORD).status_code == 201
+    assert login("192.0.2.1", "other@example.com", "wrong").status_code == 401
+    assert (
+        client.post(
+            "/token", data={"username": USERNAME, "password": PASSWORD}
+        ).status_code
+        == 201
+    )
+
+
+def test_social_links_are_read_back_by_their_enum_value(client, auth_headers):
+    """Test that a social link can be read and deleted by the platform it was put."""
+    link = {"platform": "GitHub", "link": "https://github.com/example"}
+    response = client.put("/social_links", json=link, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["platform"] == "github"
+    assert client.get("/social_links/github").json()["link"] == link["link"]
+    link["platform"] = "MySpace"
+    response = client.put("/social_links", json=link, headers=auth_headers)
+    assert response.status_code == 422
+    assert (
+        client.delete("/social_links/MySpace", headers=auth_headers).status_code == 422
+    )
+    response = client.delete("/social_links/github", headers=auth_headers)
+    assert response.status_code == 204
+    assert client.get("/social_links/github").status_code == 404
+
+
+def test_stored_values_keep_their_python_literal_meaning(
+    client, auth_headers, full_resume
+):
+    """Test that stored values are parsed as Python literals and nothing else."""
+    # pylint: disable=unused-argument
+    values = {"EDITOR": "null", "TERMINAL": "true"}
+    for preference, value in values.items():
+        client.put(
+            "/preferences",
+            json={"preference": preference, "value": value},
+            headers=auth_headers,
+        )
+    response = client.get("/")
+    assert response.status_code == 200
+    preferences = response.json()["preferences"]
+    assert preferences["OS"] == ["Linux"]
+    assert preferences["EDITOR"] == "null"
+    assert preferences["TERMINAL"] == "true"
+
+
+def test_failed_preloads_are_logged(client, monkeypatch, caplog):
+    """Test that a section failing to preload is logged rather than fatal."""
+    # pylint: disable=unused-argument
+
+    def broken_get_interests_by_category(session, category):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(
+        main.resume, "get_interests_by_category", broken_get_interests_by_category
+    )
+    main.warm_resume_caches()
+    failures = [
+        record.exc_info[0]
+        for record in caplog.records
+        if record.getMessage().startswith("Could not preload")
+    ]
+    assert failures.count(RuntimeError) == len(models.InterestTypes)